@@ -5,18 +5,31 @@ Includes the core game window initialization, event handling, and game state man
 """
 
 import alien_horde
+import asset_registry
+import atlas
 import game_stats
 import hud
+import laser
 import lose_screen
+import os
 import ship
+import profiler
 import pygame
+import renderer
+import replay
+import scheduler
 import settings
-from dataclasses import dataclass
+import sound_manager
+import text_cache
+import time
+from dataclasses import dataclass, fields
+from functools import cached_property
 from enum import Enum, auto
 
 
 class GameState(Enum):
         SPAWNING = auto()
+        READY = auto()
         PLAYING = auto()
         DESCENT = auto()
         LOSE_DELAY = auto()
@@ -27,10 +40,11 @@ class GameState(Enum):
 class Resources:
         """Dataclass to cache preloaded images and sounds for smoother gameplay"""
         ship_image: pygame.Surface
+        life_icon: pygame.Surface
         laser_image: pygame.Surface
         alien_image: pygame.Surface
-        laser_sound: pygame.mixer.Sound
-        impact_sound: pygame.mixer.Sound
+        laser_sound: sound_manager.SoundEffect | asset_registry.SilentSound
+        impact_sound: sound_manager.SoundEffect | asset_registry.SilentSound
         background: pygame.Surface
         icon: pygame.Surface
 
@@ -38,35 +52,98 @@ class Resources:
 class AlienInvasion:
         """Main game controller for the Alien Invasion application."""
 
-        def __init__(self) -> None:
-                pygame.init()
+        def __init__(self, headless: bool = False, uncapped: bool | None = None, overrides: dict | None = None) -> None:
+                """
+                Build the game. Headless games use the SDL dummy drivers, render to
+                an offscreen surface and never touch the mixer; they run uncapped
+                unless told otherwise. `overrides` sets Settings values: plain ones
+                (e.g. headless_screen_size) before the screen-derived values are
+                computed, derived ones (e.g. horde_size) after.
+                """
+                self.headless = headless
+                self.startup = profiler.StartupTimer()
+
+                # Only initialize the pygame modules the game uses
+                if self.headless:
+                        os.environ['SDL_VIDEODRIVER'] = 'dummy'
+                        os.environ['SDL_AUDIODRIVER'] = 'dummy'
+                pygame.display.init()
+                pygame.font.init()
+                if not self.headless:
+                        try:
+                                pygame.mixer.init()
+                        except pygame.error as e:
+                                print("Audio unavailable!:", e)
+                self.startup.mark('pygame')
+
+                # Init fields go to the constructor so the derived sizes see them
+                overrides = overrides or {}
+                init_fields = {f.name for f in fields(settings.Settings) if f.init}
+                self.settings = settings.Settings(**{
+                        'headless': headless,
+                        'uncapped': headless if uncapped is None else uncapped,
+                        **{name: value for name, value in overrides.items() if name in init_fields},
+                })
+                for name, value in overrides.items():
+                        if name not in init_fields:
+                                setattr(self.settings, name, value)
+
+                # Fixed-timestep simulation clock (ms of unpaused game time)
+                self.tick_ms: float = 1000 / self.settings.sim_rate
+                self.sim_time: float = 0.0
+                self.tick_count: int = 0
 
-                self.settings = settings.Settings()
                 self.stats = game_stats.GameStats(self)
+                self.startup.mark('settings')
+
+                if self.headless:
+                        # Image conversion needs a video mode; draw offscreen instead
+                        if pygame.display.get_surface() is None:
+                                pygame.display.set_mode((1, 1))
+                        self.screen = pygame.Surface(self.settings.screen_size)
+                else:
+                        self.screen = pygame.display.set_mode((self.settings.screen_size))
 
-                self.screen = pygame.display.set_mode((self.settings.screen_size))
+                self.startup.mark('display')
 
                 # Player input lock (disabled during horde spawn)
                 self.allow_player_input: bool = False
 
-                # Preload resources
+                # Preload resources (scaled and converted once, shared by every entity)
+                self.assets = asset_registry.AssetRegistry(audio=not self.headless, cache_dir=self.settings.asset_cache)
+
+                # Sound effects get reserved channels and play at most
+                # sound_plays_per_tick times per simulation tick
+                self.sounds = sound_manager.SoundManager(
+                        self.assets, lambda: self.tick_count, self.settings.sound_plays_per_tick
+                )
+
+                # Sprite images are regions of one atlas surface, or standalone surfaces
+                sprite_entries = atlas.sprite_entries(self.settings)
+                if self.settings.texture_atlas:
+                        sprites = self.assets.atlas(sprite_entries)
+                else:
+                        sprites = {name: self.assets.image(path, size) for name, (path, size) in sprite_entries.items()}
+
                 self.resources = Resources(
-                        ship_image=pygame.image.load(self.settings.ship_image).convert_alpha(),
-                        laser_image=pygame.image.load(self.settings.laser_graphic).convert_alpha(),
-                        alien_image=pygame.transform.scale(
-                                pygame.image.load(self.settings.alien_image).convert_alpha(),
-                                self.settings.alien_size
-                        ),
-                        laser_sound=pygame.mixer.Sound(self.settings.laser_noise),
-                        impact_sound=pygame.mixer.Sound(self.settings.impact_noise),
-                        background=pygame.transform.scale(
-                                pygame.image.load(self.settings.background).convert(),
-                                self.settings.screen_size
-                        ),
-                        icon=pygame.image.load(self.settings.icon)
+                        ship_image=sprites['ship'],
+                        life_icon=sprites['life'],
+                        laser_image=sprites['laser'],
+                        alien_image=sprites['alien'],
+                        laser_sound=self.sounds.effect(self.settings.laser_noise, self.settings.laser_sound_channels),
+                        impact_sound=self.sounds.effect(self.settings.impact_noise, self.settings.impact_sound_channels),
+                        background=self.assets.image(self.settings.background, self.settings.screen_size, alpha=False),
+                        icon=self.assets.image(self.settings.icon)
                 )
 
+                self.startup.mark('assets')
+
+                # Fonts per (path, size) and an LRU cache of rendered text
+                self.font_manager = text_cache.FontManager()
+                self.text_cache = text_cache.TextCache(self.settings.text_cache_size)
+
                 self.hud = hud.HUD(self)
+                self.startup.mark('hud')
 
                 self.screen_rect = self.screen.get_rect(
                         midbottom=(
@@ -75,8 +152,9 @@ class AlienInvasion:
                         )
                 )
 
-                pygame.display.set_caption(self.settings.name)
-                pygame.display.set_icon(self.resources.icon)
+                if not self.headless:
+                        pygame.display.set_caption(self.settings.name)
+                        pygame.display.set_icon(self.resources.icon)
 
                 self.sky_image = self.resources.background
                 self.sky_rect = self.sky_image.get_rect()
@@ -85,43 +163,75 @@ class AlienInvasion:
                 self.ship_group = pygame.sprite.GroupSingle()
                 self.ship_group.add(self.ship)
 
-                self.lasers = pygame.sprite.Group()
+                self.lasers = renderer.BatchGroup()
+                self.laser_pool = laser.LaserPool(self, self.settings.laser_pool_size, self.resources)
 
                 # Create alien horde (starts in spawning state)
-                self.horde = alien_horde.AlienHorde(self, self.resources)
+                if self.settings.horde_engine == 'numpy':
+                        # Imported lazily so NumPy stays an optional dependency
+                        import numpy_horde
+                        self.horde = numpy_horde.NumpyHorde(self, self.resources)
+                else:
+                        self.horde = alien_horde.AlienHorde(self, self.resources)
+                self.startup.mark('entities')
 
                 self.you_lose: bool = False
                 self.running: bool = True
                 self.paused: bool = True
 
-                # Pause timing
-                self.pause_start_time: int | None = None
-                self.pause_duration: int = 0
+                # Fraction of a tick rendered ahead when interpolating
+                self.interpolation: float = 0.0
 
                 # Set initial state
                 self.state: GameState = GameState.SPAWNING
 
-                # Lose screen
-                self.lose_screen = lose_screen.LoseScreen(self)
+                # Timed state transitions run off the simulation clock
+                self.scheduler = scheduler.Scheduler()
 
-                # Lose screen timing
-                self.lose_time_start: int | None = None
-                self.lose_delay_ms: int = 1000
+                # Per-tick input recorder, or a player feeding a recording back
+                self.replay: replay.ReplayRecorder | replay.ReplayPlayer | None = (
+                        replay.ReplayRecorder(self, self.settings.record_replay)
+                        if self.settings.record_replay else None
+                )
+
+                # Optional dirty-rect renderer (full redraw + flip otherwise)
+                self.renderer: renderer.DirtyRenderer | None = (
+                        renderer.DirtyRenderer(self) if self.settings.dirty_rendering else None
+                )
 
                 self.clock = pygame.time.Clock()
+                self.frame_count: int = 0
+
+                # Frame profiler; wraps nothing until enabled
+                self.profiler = profiler.FrameProfiler(self, self.settings.profiler_window)
+                if self.settings.profiler:
+                        self.profiler.enable()
 
+                self.startup.mark('systems')
 
-        def _event_listener(self) -> None:
+
+        @cached_property
+        def lose_screen(self) -> lose_screen.LoseScreen:
+                """Built on first use; most sessions never reach it."""
+                return lose_screen.LoseScreen(self)
+
+
+        def _event_listener(self, events: list[pygame.event.Event] | None = None) -> None:
                 """Listens for events like quit, or keyboard input."""
 
                 # Get all events
-                for event in pygame.event.get():
+                for event in pygame.event.get() if events is None else events:
 
                         # Quit game
                         if event.type == pygame.QUIT:
-                                self.running = False
-                                pygame.quit()
-                                exit()
+                                self.quit_game()
+
+                        # Window uncovered or restored: its old contents are gone
+                        elif event.type in (pygame.WINDOWEXPOSED, pygame.VIDEOEXPOSE):
+                                if self.state == GameState.LOSE_SCREEN:
+                                        self.lose_screen.invalidate()
+                                if self.renderer:
+                                        self.renderer.invalidate()
 
                         # Mouse left click event
                         elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
@@ -163,9 +273,7 @@ class AlienInvasion:
                         self.ship.state.firing_rapid = True
 
                 elif event.key == pygame.K_ESCAPE:
-                        self.running = False
-                        pygame.quit()
-                        exit()
+                        self.quit_game()
 
 
         def _key_up_event(self, event) -> None:
@@ -176,6 +284,11 @@ class AlienInvasion:
                         self._toggle_pause()
                         return
 
+                # Profiler overlay always allowed
+                if event.key == pygame.K_F3:
+                        self.profiler.toggle()
+                        return
+
                 if not self.allow_player_input:
                         return
 
@@ -195,8 +308,9 @@ class AlienInvasion:
 
         def _toggle_pause(self) -> None:
                 """
-                Handles the play button rect and the effects on the laser
-                fire cooldown of the game pausing
+                Handles the play button rect when the game is paused or unpaused.
+                The simulation clock stops while paused, so laser fire cooldowns
+                need no adjusting.
                 """
 
                 # Going from unpaused to paused
@@ -208,33 +322,35 @@ class AlienInvasion:
                         # Display the play button
                         self.hud.play_button.rect.center = self.screen_rect.center
 
-                        # Get current tick for pause start time
-                        self.pause_start_time = pygame.time.get_ticks()
-
                 # Going from paused to unpaused
                 else:
-
-                        # Unpause game and reset pause timer
                         self.paused = False
-                        paused_time = 0
-
-                        # Calculate pause duration
-                        if self.pause_start_time != None:
-                                paused_time = pygame.time.get_ticks() - self.pause_start_time
-                        self.pause_duration += paused_time
-
-                        # Set pause timer to None
-                        self.pause_start_time = None
 
 
         def on_horde_spawn_complete(self) -> None:
                 """
                 Called by AlienHorde when spawn descent finishes.
-                Enables player input and begins active gameplay.
+                Holds the horde briefly, then enables player input and begins
+                active gameplay.
                 """
-                pygame.time.delay(500)
-                self.allow_player_input = True
-                self.state = GameState.PLAYING
+                self.state = GameState.READY
+                self._transition_after(self.settings.ready_delay_ms, GameState.PLAYING)
+
+
+        def _transition_after(self, delay_ms: int, state: GameState) -> None:
+                """Schedules a move to `state` once `delay_ms` of game time has passed."""
+                self.scheduler.schedule(delay_ms, self._enter_state, state)
+
+
+        def _enter_state(self, state: GameState) -> None:
+                """Switches game state, applying the state's entry effects."""
+                self.state = state
+
+                if state == GameState.PLAYING:
+                        self.allow_player_input = True
+                elif state == GameState.LOSE_SCREEN:
+                        # The game frame is on the display; put the lose screen back up
+                        self.lose_screen.invalidate()
 
 
 
@@ -253,29 +369,73 @@ class AlienInvasion:
                 else:
                         self.you_lose = True
                         self.state = GameState.LOSE_DELAY
-                        self.lose_time_start = pygame.time.get_ticks()
+                        self._transition_after(self.settings.lose_delay_ms, GameState.LOSE_SCREEN)
+                        self.stats.flush_scores()
+                        self.stats.record_game()
 
 
 
         def _update_screen(self) -> None:
                 """Updates the screen with relevant movements, sprites, and UI elements"""
                 if self.state == GameState.LOSE_SCREEN:
-                        self.lose_screen.draw()
-                        pygame.display.flip()
+                        # Nothing to present while the cached frame is already up
+                        if self.lose_screen.draw():
+                                self._flip()
+
+                        # Whole screen was overwritten; repaint it when play resumes
+                        if self.renderer:
+                                self.renderer.invalidate()
                         return
 
+                if self.renderer:
+                        self.renderer.draw()
+                        return
+
+                ship_offset, laser_offset, horde_offset = self._render_offsets()
+
                 self.screen.blit(self.sky_image, (0, 0))
-                self.ship_group.draw(self.screen)
-                self.lasers.draw(self.screen)
-                self.horde.group.draw(self.screen)
+                if self.ship_group.sprite:
+                        self.screen.blit(self.ship_group.sprite.image, self.ship_group.sprite.rect.move(ship_offset))
+                self.lasers.draw(self.screen, laser_offset, rects=False)
+                self.horde.draw(self.screen, horde_offset, rects=False)
                 self.hud.draw(self.screen)
 
-                pygame.display.flip()
+                if self.profiler.enabled:
+                        self.profiler.draw(self.screen)
+
+                self._flip()
+
+
+        def _flip(self, rects: list[pygame.Rect] | None = None) -> None:
+                """
+                Presents the finished frame, or only `rects` of it when given
+                (skipped when headless).
+                """
+                if self.headless:
+                        return
+
+                if rects is None:
+                        pygame.display.flip()
+                else:
+                        pygame.display.update(rects)
+
+
+        def quit_game(self) -> None:
+                """Persists scores, shuts pygame down and exits."""
+                self.running = False
+                if isinstance(self.replay, replay.ReplayRecorder):
+                        self.replay.save()
+                self.stats.close()
+                pygame.quit()
+                exit()
 
 
         def restart_game(self) -> None:
                 self.stats.reset_stats()
-                self.lasers.empty()
+
+                # Kill (rather than empty) so pooled lasers are returned
+                for shot in self.lasers.sprites():
+                        shot.kill()
                 self.ship_group.empty()
 
                 self.ship = ship.Ship(self, self.resources)
@@ -285,28 +445,141 @@ class AlienInvasion:
                 self.you_lose = False
                 self.paused = False
                 self.state = GameState.SPAWNING
+                self.scheduler.clear()
+
+                if self.replay:
+                        self.replay.on_restart()
 
                 self.horde.reset()
 
 
 
-        def run_game(self) -> None:
+        def _simulate(self) -> None:
+                """
+                Advances the game by one fixed simulation tick. Timers keep running
+                while the horde is held (READY, LOSE_DELAY) but stop while paused.
+                """
+                if self.replay:
+                        self.replay.on_tick()
+
+                if not self.paused and self.state != GameState.LOSE_SCREEN:
+                        self.sim_time += self.tick_ms
+                        self.scheduler.advance(self.sim_time)
+
+                        if self.state in (GameState.SPAWNING, GameState.PLAYING):
+                                self.horde.update()
+
+                        if self.state == GameState.PLAYING:
+                                self.ship_group.update()
+                                self.lasers.update()
+
+                self.tick_count += 1
+
+
+        def step(self) -> None:
+                """Runs a single frame with exactly one simulation tick: input, simulation, and rendering."""
+                self._begin_frame()
+                self._event_listener()
+                self._simulate()
+                self._update_screen()
+                self._end_frame()
+
+
+        def _wait_for_input(self) -> None:
+                """
+                Blocks until an event arrives and handles it, waking after
+                Settings.lose_screen_wake_ms regardless so a leaderboard that
+                finishes loading in the background still gets drawn.
+                """
+                event = pygame.event.wait(self.settings.lose_screen_wake_ms)
+                if event.type != pygame.NOEVENT:
+                        self._event_listener([event, *pygame.event.get()])
+
+
+        def _begin_frame(self) -> None:
+                if self.profiler.enabled:
+                        self.profiler.begin_frame()
+
+
+        def _end_frame(self) -> None:
+                self.frame_count += 1
+                if self.frame_count == 1:
+                        self.startup.first_frame()
+                        if self.settings.report_startup:
+                                print(self.startup.report())
+                if self.profiler.enabled:
+                        self.profiler.end_frame()
+
+
+        def _render_offsets(self) -> tuple[tuple[int, int], tuple[int, int], tuple[int, int]]:
+                """
+                Returns the (ship, laser, horde) draw offsets that push sprites
+                forward by the fraction of a tick left in the accumulator. Zero
+                unless interpolating while the simulation is running.
+                """
+                if not self.interpolation or self.paused or self.state not in (GameState.SPAWNING, GameState.PLAYING):
+                        return (0, 0), (0, 0), (0, 0)
+
+                # The ship and lasers only move once the game is playing; the ship
+                # moves with them so fresh lasers stay attached to it
+                ship_offset = laser_offset = (0, 0)
+                if self.state == GameState.PLAYING:
+                        laser_offset = (0, -round(self.interpolation * self.settings.laser_speed))
+                        if self.ship_group.sprite:
+                                ship_offset = (round(self.interpolation * self.ship_group.sprite.velocity()), 0)
+
+                dx, dy = self.horde.velocity()
+                return ship_offset, laser_offset, (round(self.interpolation * dx), round(self.interpolation * dy))
+
+
+        def run_game(self, max_frames: int | None = None) -> None:
+                """
+                Runs the game loop until quit, or for `max_frames` frames.
+
+                The simulation ticks at a fixed Settings.sim_rate from an accumulator
+                while rendering runs as fast as Settings.fps allows (0 = unlimited).
+                At most Settings.max_catchup_steps ticks run per frame; anything
+                beyond that is dropped so slow machines slow down instead of
+                spiraling. Uncapped games step one tick per frame with no clock.
+                """
+                previous = time.perf_counter()
+                accumulator = 0.0
+
                 while self.running:
+                        if max_frames is not None and self.frame_count >= max_frames:
+                                break
+
+                        if self.settings.uncapped:
+                                self.step()
+                                continue
+
+                        # Nothing moves on the lose screen: sleep until input instead
+                        # of spinning, and don't count the sleep as simulation time
+                        if self.state == GameState.LOSE_SCREEN and self.lose_screen.idle:
+                                self._wait_for_input()
+                                previous = time.perf_counter()
+
+                        now = time.perf_counter()
+                        accumulator += (now - previous) * 1000
+                        previous = now
+
+                        self._begin_frame()
                         self._event_listener()
 
-                        if self.state == GameState.LOSE_DELAY:
-                                now = pygame.time.get_ticks()
-                                if self.lose_time_start != None and now - self.lose_time_start >= self.lose_delay_ms:
-                                        self.state = GameState.LOSE_SCREEN
+                        steps = 0
+                        while accumulator >= self.tick_ms and steps < self.settings.max_catchup_steps:
+                                self._simulate()
+                                accumulator -= self.tick_ms
+                                steps += 1
 
-                        elif not self.paused and self.state != GameState.LOSE_SCREEN:
-                                self.horde.update()
+                        # Too far behind: drop the backlog rather than spiral
+                        if accumulator >= self.tick_ms:
+                                accumulator = self.tick_ms - 1e-6
 
-                                if self.state == GameState.PLAYING:
-                                        self.ship_group.update()
-                                        self.lasers.update()
+                        self.interpolation = accumulator / self.tick_ms if self.settings.interpolate else 0.0
 
                         self._update_screen()
+                        self._end_frame()
                         self.clock.tick(self.settings.fps)
 
 
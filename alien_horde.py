@@ -7,6 +7,9 @@ of the alien sprite group.
 
 import pygame
 from alien import Aliens
+from collections import Counter
+from collision_index import ColumnIndex
+from renderer import BatchGroup
 from typing import TYPE_CHECKING
 from dataclasses import dataclass
 
@@ -16,7 +19,7 @@ if TYPE_CHECKING:
         from Alien_Invasion import AlienInvasion
 
 
-@dataclass
+@dataclass(slots=True)
 class HordeState:
         spawning: bool = True
         spawn_remaining: int = 0
@@ -26,6 +29,17 @@ class HordeState:
 
 
 
+def horde_velocity(state: HordeState, settings) -> tuple[int, int]:
+        """Per-tick (dx, dy) movement of a horde in `state`."""
+        if state.spawning:
+                return 0, min(state.spawn_remaining, settings.horde_speed)
+        if state.descent_stage:
+                return 0, settings.horde_speed
+        if state.advancing:
+                return 0, min(state.advance_remaining, settings.horde_speed)
+        return settings.horde_speed * settings.horde_direction, 0
+
+
 class AlienHorde:
         """Houses the alien horde building mechanics."""
 
@@ -36,10 +50,20 @@ class AlienHorde:
                 self.game = game
                 self.settings = game.settings
                 self.stats = game.stats
-                self.resources = resources
+                self.resources = resources or game.resources
 
                 # Initialize horde group
-                self.group = pygame.sprite.Group()
+                self.group = BatchGroup()
+
+                # Column buckets so lasers are only tested against their own column
+                self.index = ColumnIndex(self.settings.alien_size[0] + self.settings.horde_padding)
+
+                # Aggregate bounding rect, shifted with every move and recomputed
+                # only when the last alien of an outer row or column dies
+                self.bounds = pygame.Rect(0, 0, 0, 0)
+                self._cell_of: dict[Aliens, tuple[int, int]] = {}
+                self._row_counts: Counter[int] = Counter()
+                self._col_counts: Counter[int] = Counter()
 
                 # Horde state
                 self.state = HordeState()
@@ -60,6 +84,13 @@ class AlienHorde:
                 self.state.spawning = True
                 self.state.spawn_remaining = total_height + alien_size[1] + padding
 
+                # Left edge of column 0 (alien rects are positioned by center)
+                self.index.clear()
+                self.index.origin_x = alien_size[0] + padding - alien_size[0] // 2
+                self._cell_of.clear()
+                self._row_counts.clear()
+                self._col_counts.clear()
+
                 for row in range(self.settings.horde_size[0]):
                         for col in range(self.settings.horde_size[1]):
 
@@ -67,11 +98,7 @@ class AlienHorde:
                                 if (row + col) % 2 != 0:
                                         continue
 
-                                alien = (
-                                        Aliens(self.game, alien_size[0], alien_size[1], self.resources)
-                                        if self.resources
-                                        else Aliens(self.game, alien_size[0], alien_size[1])
-                                )
+                                alien = Aliens(self.game, alien_size[0], alien_size[1], self.resources)
 
                                 alien.rect.center = (
                                         alien_size[0] + padding + (col * (alien_size[0] + padding)),
@@ -79,56 +106,59 @@ class AlienHorde:
                                 )
 
                                 self.group.add(alien)
+                                self.index.add(alien, col)
+                                self._cell_of[alien] = (row, col)
+                                self._row_counts[row] += 1
+                                self._col_counts[col] += 1
 
+                self._recompute_bounds()
+
+        def __len__(self) -> int:
+                return len(self.group)
 
         def _check_collisions(self) -> None:
                 """
                 Handles collision detection for the edges of the screen, the player ship rect,
                 and the laser rects.
                 """
-                screen_rect = self.game.screen.get_rect()
+                screen_rect = self.game.screen_rect
 
-                # Only one pass through the aliens
-                for alien in self.group.sprites():
+                # Edge and bottom checks only need the horde's bounding rect
+                if self.group:
 
-                        # Check if any alien hits the bottom or collides with the player
-                        if not self.state.descent_stage and (alien.rect.bottom >= screen_rect.bottom):
+                        # Check if any alien hits the bottom (final descent takes priority)
+                        if not self.state.descent_stage and self.bounds.bottom >= screen_rect.bottom:
                                 self.state.descent_stage = True
                                 self.game.you_lose = True
-                                break  # final descent takes priority
 
                         # Check if the horde hits screen edges (only if not advancing or descending)
-                        if not self.state.advancing and not self.state.descent_stage and alien.check_edges():
+                        elif not self.state.advancing and not self.state.descent_stage and (
+                                self.bounds.right >= screen_rect.right or self.bounds.left <= 0
+                        ):
                                 self.state.advancing = True
                                 self.state.advance_remaining = self.settings.horde_advance
-                                break
 
-                # Delete self and laser when alien in horde is shot
-                laser_collisions = pygame.sprite.groupcollide(
-                        self.group,
-                        self.game.lasers,
-                        True,
-                        True
-                        )
+                # Delete self and laser when alien in horde is shot (broadphase by column)
+                laser_collisions = self.index.collide(self.game.lasers)
+                for alien, lasers in laser_collisions.items():
+                        self._kill(alien)
+                        for laser in lasers:
+                                laser.kill()
 
                 # Play destruct sound effect (shortened for performance)
                 for collision in laser_collisions:
-                        pygame.mixer.Sound(self.settings.impact_noise).play(0, 325, 0)
+                        self.resources.impact_sound.play(0, 325, 0)
 
-                        # Add value of alien to score
+                # Add value of aliens to score
+                if laser_collisions:
                         self.stats.update(laser_collisions)
-                        print(f"Score: {self.stats.score}")
 
-                ship_collisions = pygame.sprite.groupcollide(
-                        self.group,
-                        self.game.ship_group,
-                        False,
-                        False
-                        )
+                ship = self.game.ship_group.sprite
+                ship_collisions = ship is not None and self.index.any_collide(ship.rect)
 
                 if ship_collisions and not self.state.descent_stage:
                         self.game.ship_group.empty()
-                        pygame.mixer.Sound.play(pygame.mixer.Sound(self.settings.impact_noise))
+                        self.resources.impact_sound.play()
                         self.state.descent_stage = True
                         self.game.you_lose = True
 
@@ -137,6 +167,33 @@ class AlienHorde:
                         self.stats.update_wave()
                         self.reset()
 
+        def _kill(self, alien: Aliens) -> None:
+                """Removes an alien from the horde, the collision index and the bounds."""
+                alien.kill()
+                self.index.remove(alien)
+
+                row, col = self._cell_of.pop(alien)
+                self._row_counts[row] -= 1
+                self._col_counts[col] -= 1
+
+                # Bounds only change when an outer row or column empties
+                emptied_row = not self._row_counts[row]
+                emptied_col = not self._col_counts[col]
+                if emptied_row:
+                        del self._row_counts[row]
+                if emptied_col:
+                        del self._col_counts[col]
+
+                if (emptied_row and (not self._row_counts or row < min(self._row_counts) or row > max(self._row_counts))) or (
+                        emptied_col and (not self._col_counts or col < min(self._col_counts) or col > max(self._col_counts))
+                ):
+                        self._recompute_bounds()
+
+        def _recompute_bounds(self) -> None:
+                """Rebuilds the bounding rect from the remaining aliens."""
+                rects = [alien.rect for alien in self.group]
+                self.bounds = rects[0].unionall(rects[1:]) if rects else pygame.Rect(0, 0, 0, 0)
+
         def _advance_and_reverse(self) -> None:
                 """
                 Move the horde downward by one alien height and reverse horizontal
@@ -146,6 +203,7 @@ class AlienHorde:
                 # preferred path is the timed advance performed in `update`.
                 for alien in self.group.sprites():
                         alien.rect.y += self.settings.horde_advance
+                self.bounds.y += self.settings.horde_advance
                 self.settings.horde_direction *= -1
 
         def update(self) -> None:
@@ -155,6 +213,7 @@ class AlienHorde:
                         if step > 0:
                                 for alien in self.group.sprites():
                                         alien.rect.y += step
+                                self.bounds.y += step
                                 self.state.spawn_remaining -= step
 
                         if self.state.spawn_remaining <= 0:
@@ -165,10 +224,11 @@ class AlienHorde:
 
                 # If in final descent, move all aliens straight down
                 if self.state.descent_stage:
+                        self.bounds.y += self.settings.horde_speed
                         for alien in self.group.sprites():
                                 alien.rect.y += self.settings.horde_speed
                                 if alien.rect.top > self.game.screen_rect.bottom:
-                                        alien.kill()
+                                        self._kill(alien)
 
                         if not self.group:
                                 self.game.on_descent_complete()
@@ -180,6 +240,7 @@ class AlienHorde:
 
                         for alien in self.group.sprites():
                                 alien.rect.y += step
+                        self.bounds.y += step
 
                         self.state.advance_remaining -= step
 
@@ -192,12 +253,29 @@ class AlienHorde:
 
                 # Normal horizontal movement
                 self.group.update()
+                dx = self.settings.horde_speed * self.settings.horde_direction
+                self.index.shift(dx)
+                self.bounds.x += dx
                 self._check_collisions()
 
+        def velocity(self) -> tuple[int, int]:
+                """Returns how far the horde will move on its next tick."""
+                return horde_velocity(self.state, self.settings)
+
+        def draw(self, surface: pygame.Surface, offset: tuple[int, int] = (0, 0), rects: bool = True) -> list[pygame.Rect] | None:
+                """Draws the horde (shifted by `offset`) and returns the rects it covered, if asked."""
+                return self.group.draw(surface, offset, rects)
+
+        def alien_rects(self) -> list[pygame.Rect]:
+                """Returns the rects of every living alien."""
+                return [alien.rect for alien in self.group]
+
         def reset(self) -> None:
                 """
                 Resets the horde for level advancing and life loss
                 """
                 self.group.empty()
+                self.index.clear()
+                self._cell_of.clear()
                 self.state = HordeState()
                 self._create_horde()
@@ -0,0 +1,200 @@
+"""
+Central asset registry for the Alien Invasion game.
+
+Loads, scales, and converts every image and sound exactly once, caching
+the result so entities never touch the disk once the game is running.
+Scaled images can also be baked to disk as raw pixel buffers, so later
+launches at the same resolution skip PNG decoding and scaling.
+"""
+
+from pathlib import Path
+import hashlib
+import os
+import struct
+import tempfile
+import pygame
+from atlas import TextureAtlas, pack
+
+
+# Magic, width, height, pixel format of a baked image file
+BAKED_HEADER = struct.Struct('<4sII4s')
+BAKED_MAGIC = b'AIBK'
+
+
+class SilentSound:
+        """Stand-in for pygame.mixer.Sound when audio is disabled."""
+
+        def play(self, *args, **kwargs) -> None:
+                return None
+
+
+class AssetRegistry:
+        """
+        Caches loaded assets keyed by how they were prepared.
+
+        Images are keyed by (path, size, alpha) so the same file scaled to two
+        different sizes is stored twice, while repeated requests for the same
+        size return the already converted surface. Sounds are keyed by path.
+        With audio disabled, sounds are never decoded and the mixer is never
+        touched. Atlases are keyed by their full list of (name, path, size).
+
+        Given a `cache_dir`, scaled pixels are baked to disk keyed by (source
+        path, source mtime and size, target size, pixel format) and loaded back
+        with frombuffer, so only the final convert runs on a warm start.
+        """
+
+        def __init__(self, audio: bool = True, cache_dir: Path | None = None) -> None:
+                self.audio = audio
+                self.cache_dir = cache_dir
+                self._images: dict[tuple[Path, tuple[int, int] | None, bool], pygame.Surface] = {}
+                self._sounds: dict[Path, pygame.mixer.Sound] = {}
+                self._atlases: dict[tuple, TextureAtlas] = {}
+
+                # Disk cache counters
+                self.baked_hits: int = 0
+                self.baked_misses: int = 0
+
+        def image(self, path: Path, size: tuple[int, int] | None = None, alpha: bool = True) -> pygame.Surface:
+                """
+                Return the image at `path`, scaled to `size` and converted for
+                fast blitting. Requires the display mode to be set.
+                """
+                key = (Path(path), size, alpha)
+                surface = self._images.get(key)
+
+                if surface is None:
+                        surface = self._scaled(key)
+                        surface = surface.convert_alpha() if alpha else surface.convert()
+                        self._images[key] = surface
+
+                return surface
+
+        def atlas(self, entries: dict[str, tuple[Path, tuple[int, int]]], padding: int = 1) -> TextureAtlas:
+                """
+                Return a texture atlas of the named (path, size) images. The packed
+                pixels are baked like any other image, so a warm start reads the
+                whole atlas with one file read.
+                """
+                key = tuple(sorted((name, Path(path), size) for name, (path, size) in entries.items()))
+                atlas = self._atlases.get(key)
+
+                if atlas is None:
+                        atlas_size, regions = pack({name: size for name, (_, size) in entries.items()}, padding)
+
+                        # The label names the layout; the digest tracks the sources
+                        layout = hashlib.sha1(repr(key).encode()).hexdigest()[:8]
+                        label = f"atlas-{atlas_size[0]}x{atlas_size[1]}-{layout}"
+                        baked = self._baked_path(label, [path for _, path, _ in key]) if self.cache_dir else None
+
+                        surface = self._load_baked(baked) if baked else None
+                        if surface is None:
+                                surface = pygame.Surface(atlas_size, pygame.SRCALPHA)
+                                for name, (path, size) in entries.items():
+                                        # RGBA_MAX onto a clear surface copies pixels without blending
+                                        # Inputs skip the disk cache: warm starts only read the atlas
+                                        image = self._scaled((Path(path), size, True), cached=False).convert_alpha()
+                                        surface.blit(image, regions[name], special_flags=pygame.BLEND_RGBA_MAX)
+                                if baked:
+                                        self._bake(baked, label, surface, 'RGBA')
+
+                        atlas = TextureAtlas(surface.convert_alpha(), regions)
+                        self._atlases[key] = atlas
+
+                return atlas
+
+        def _scaled(self, key: tuple[Path, tuple[int, int] | None, bool], cached: bool = True) -> pygame.Surface:
+                """
+                Unconverted, scaled pixels for `key`, from the disk cache when
+                possible (and `cached`).
+                """
+                path, size, alpha = key
+                label = f"{path.stem}-{f'{size[0]}x{size[1]}' if size else 'full'}-{'rgba' if alpha else 'rgb'}"
+                baked = self._baked_path(label, [path]) if self.cache_dir and cached else None
+
+                surface = self._load_baked(baked) if baked else None
+                if surface is None:
+                        surface = pygame.image.load(path)
+                        if size is not None:
+                                surface = pygame.transform.scale(surface, size)
+                        if baked:
+                                self._bake(baked, label, surface, 'RGBA' if alpha else 'RGB')
+
+                return surface
+
+        def _baked_path(self, label: str, sources: list[Path]) -> Path:
+                """Cache file for `label`; its name changes whenever a source file does."""
+                version = '|'.join(
+                        f"{path.resolve()}|{stat.st_mtime_ns}|{stat.st_size}"
+                        for path, stat in ((path, path.stat()) for path in sources)
+                )
+                digest = hashlib.sha1(version.encode()).hexdigest()[:16]
+                return self.cache_dir / f"{label}-{digest}.raw"
+
+        def _load_baked(self, baked: Path) -> pygame.Surface | None:
+                try:
+                        data = baked.read_bytes()
+                except OSError:
+                        self.baked_misses += 1
+                        return None
+
+                # A short, corrupt or foreign file is a miss, never a crash
+                try:
+                        if len(data) < BAKED_HEADER.size:
+                                raise ValueError("truncated header")
+                        magic, width, height, fmt = BAKED_HEADER.unpack_from(data)
+                        fmt = fmt.decode().strip()
+                        if magic != BAKED_MAGIC or len(data) != BAKED_HEADER.size + width * height * len(fmt):
+                                raise ValueError("bad header")
+                        surface = pygame.image.frombuffer(memoryview(data)[BAKED_HEADER.size:], (width, height), fmt)
+                except (struct.error, UnicodeDecodeError, ValueError):
+                        self.baked_misses += 1
+                        return None
+
+                self.baked_hits += 1
+                return surface
+
+        def _bake(self, baked: Path, label: str, surface: pygame.Surface, fmt: str) -> None:
+                """
+                Writes the pixels to a temp file, then renames it into place. The
+                temp name is unique, so processes starting on a cold cache together
+                never write or rename each other's half-finished files.
+                """
+                temp = None
+                try:
+                        self.cache_dir.mkdir(parents=True, exist_ok=True)
+                        descriptor, temp = tempfile.mkstemp(dir=self.cache_dir, prefix=baked.name + '.', suffix='.tmp')
+                        with os.fdopen(descriptor, 'wb') as file:
+                                file.write(BAKED_HEADER.pack(BAKED_MAGIC, *surface.get_size(), fmt.ljust(4).encode()))
+                                file.write(pygame.image.tobytes(surface, fmt))
+
+                        # mkstemp files are owner-only; give the bake the usual
+                        # permissions so a cache built by another account is readable
+                        umask = os.umask(0)
+                        os.umask(umask)
+                        os.chmod(temp, 0o666 & ~umask)
+                        os.replace(temp, baked)
+                        temp = None
+
+                        # Drop bakes of older versions of the same sources
+                        for stale in self.cache_dir.glob(f"{label}-*.raw"):
+                                if stale != baked:
+                                        stale.unlink(missing_ok=True)
+                except OSError as e:
+                        print("Could not cache asset!:", e)
+                finally:
+                        if temp is not None:
+                                Path(temp).unlink(missing_ok=True)
+
+        def sound(self, path: Path) -> 'pygame.mixer.Sound | SilentSound':
+                """Return the decoded sound effect at `path`."""
+                if not self.audio:
+                        return SilentSound()
+
+                key = Path(path)
+                sound = self._sounds.get(key)
+
+                if sound is None:
+                        sound = pygame.mixer.Sound(path)
+                        self._sounds[key] = sound
+
+                return sound
@@ -0,0 +1,110 @@
+"""
+Texture atlas for the Alien Invasion sprite graphics.
+
+Packs every scaled sprite image into one converted surface and hands out
+subsurfaces of it, so all sprite blits read from a single block of pixels.
+The layout depends only on the sprite sizes, so the packed pixels can be
+baked to the asset cache ahead of time and loaded with a single read.
+
+Prebuild the atlas for a screen size (from the project root):
+
+        python atlas.py --screen 1920x1080 --screen 1280x720
+"""
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+import argparse
+import math
+import os
+import pygame
+
+
+if TYPE_CHECKING:
+        from settings import Settings
+
+
+class TextureAtlas:
+        """One surface plus a lookup table of named regions within it."""
+
+        def __init__(self, surface: pygame.Surface, regions: dict[str, pygame.Rect]) -> None:
+                self.surface = surface
+                self.regions = regions
+                self._subsurfaces: dict[str, pygame.Surface] = {
+                        name: surface.subsurface(rect) for name, rect in regions.items()
+                }
+
+        def __getitem__(self, name: str) -> pygame.Surface:
+                return self._subsurfaces[name]
+
+        def __contains__(self, name: str) -> bool:
+                return name in self._subsurfaces
+
+
+def pack(sizes: dict[str, tuple[int, int]], padding: int = 1) -> tuple[tuple[int, int], dict[str, pygame.Rect]]:
+        """
+        Shelf-packs rectangles of the given sizes, tallest first. Returns the
+        atlas size and each name's rect. The same sizes always give the same
+        layout.
+        """
+        order = sorted(sizes, key=lambda name: (-sizes[name][1], -sizes[name][0], name))
+        area = sum((w + padding) * (h + padding) for w, h in sizes.values())
+        max_width = max(max(w for w, _ in sizes.values()), math.ceil(math.sqrt(area)))
+
+        regions: dict[str, pygame.Rect] = {}
+        x = y = shelf_height = width = 0
+        for name in order:
+                w, h = sizes[name]
+                if x and x + w > max_width:
+                        x, y = 0, y + shelf_height + padding
+                        shelf_height = 0
+                regions[name] = pygame.Rect(x, y, w, h)
+                x += w + padding
+                shelf_height = max(shelf_height, h)
+                width = max(width, x - padding)
+
+        return (width, y + shelf_height), regions
+
+
+def sprite_entries(settings: 'Settings') -> dict[str, tuple[Path, tuple[int, int]]]:
+        """The game's sprite images and the sizes they are drawn at."""
+        return {
+                'ship': (settings.ship_image, settings.ship_size),
+                'life': (settings.ship_image, settings.life_display_icon_size),
+                'laser': (settings.laser_graphic, settings.laser_size),
+                'alien': (settings.alien_image, settings.alien_size),
+        }
+
+
+def main() -> None:
+        parser = argparse.ArgumentParser(description="Prebuild the sprite atlas into the asset cache.")
+        parser.add_argument('--screen', action='append', help='screen size as WxH (default: this desktop)')
+        args = parser.parse_args()
+
+        # Imported here so the atlas itself has no game dependencies
+        from asset_registry import AssetRegistry
+        import settings
+
+        if args.screen:
+                os.environ['SDL_VIDEODRIVER'] = 'dummy'
+        pygame.display.init()
+        pygame.display.set_mode((1, 1), pygame.HIDDEN)
+
+        if args.screen:
+                configs = [
+                        settings.Settings(headless=True, headless_screen_size=tuple(int(v) for v in size.lower().split('x')))
+                        for size in args.screen
+                ]
+        else:
+                configs = [settings.Settings()]
+
+        for config in configs:
+                assets = AssetRegistry(audio=False, cache_dir=config.asset_cache)
+                atlas = assets.atlas(sprite_entries(config))
+                width, height = atlas.surface.get_size()
+                print(f"{config.screen_size[0]}x{config.screen_size[1]}: {width}x{height} atlas, {len(atlas.regions)} sprites")
+
+        pygame.quit()
+
+
+if __name__ == '__main__':
+        main()
@@ -0,0 +1,6 @@
+"""
+Benchmark and tooling scripts for the Alien Invasion game.
+
+Run from the project root so asset paths resolve, e.g.
+``python -m benchmarks.frame_loop``.
+"""
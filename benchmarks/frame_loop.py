@@ -0,0 +1,339 @@
+"""
+Reproducible frame loop benchmark for Alien Invasion.
+
+Drives headless games through scripted scenarios and reports per-phase
+frame-time percentiles, time spent in the hot subsystems, allocations and
+throughput. Results are written as JSON and can be compared against a
+stored baseline so regressions show up as numbers.
+
+Usage (from the project root):
+
+        python -m benchmarks.frame_loop --output bench.json
+        python -m benchmarks.frame_loop --save-baseline benchmarks/baseline.json
+        python -m benchmarks.frame_loop --baseline benchmarks/baseline.json
+        python -m benchmarks.frame_loop --engine numpy --horde-size 8x16
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable
+
+import pygame
+
+from Alien_Invasion import AlienInvasion, GameState
+from benchmarks.harness import new_game, percentile
+from settings import Settings
+
+
+# Methods timed on every frame, as (label, owner attribute path, method name)
+SECTIONS: tuple[tuple[str, str, str], ...] = (
+        ('horde.update', 'horde', 'update'),
+        ('hud.draw', 'hud', 'draw'),
+        ('_update_screen', '', '_update_screen'),
+)
+
+# Fewer timed frames than this and the tail percentiles are just the maximum
+MIN_SAMPLES = 100
+
+# Metrics checked against the baseline; True means higher is better
+COMPARED_METRICS: dict[str, bool] = {
+        'p50_ms': False,
+        'p95_ms': False,
+        'p99_ms': False,
+        'fps': True,
+}
+
+
+@dataclass
+class Scenario:
+        """A scripted phase of play: untimed setup, then timed frames."""
+        name: str
+        setup: Callable[[AlienInvasion], None]
+        before_frame: Callable[[AlienInvasion, int], None] | None = None
+        done: Callable[[AlienInvasion], bool] | None = None
+        check: Callable[[AlienInvasion], bool] | None = None  # Sanity check on the state after the timed frames
+
+
+def _run_until(game: AlienInvasion, predicate: Callable[[AlienInvasion], bool], limit: int = 10_000) -> None:
+        """Step the game without timing until `predicate` holds."""
+        for _ in range(limit):
+                if predicate(game):
+                        return
+                game.step()
+        raise RuntimeError('scenario setup did not converge')
+
+
+def _start_playing(game: AlienInvasion) -> None:
+        game.paused = False
+        _run_until(game, lambda g: g.state == GameState.PLAYING)
+
+
+# ---------- Scenarios ----------
+
+def _setup_spawn(game: AlienInvasion) -> None:
+        game.paused = False
+
+
+def _setup_rapid_fire(game: AlienInvasion) -> None:
+        # Remove the cooldown so a laser leaves the ship every frame
+        game.settings.ship_base_fire_rate = 0
+        game.settings.ship_rapid_fire_rate = 0
+        _start_playing(game)
+
+
+def _rapid_fire_frame(game: AlienInvasion, frame: int) -> None:
+        game.ship.state.firing = True
+        game.ship.state.firing_rapid = True
+
+
+def fitting_horde(settings) -> tuple[int, int]:
+        """
+        Largest (rows, columns) horde that fits the screen: every column
+        between the edges and every row above the ship once spawned.
+        """
+        alien_width, alien_height = settings.alien_size
+        padding = settings.horde_padding
+        cols = (settings.screen_size[0] - padding) // (alien_width + padding)
+        rows = (settings.screen_size[1] - settings.ship_size[1] - alien_height) // (alien_height + padding)
+        return rows, cols
+
+
+def _setup_mass_kills(game: AlienInvasion) -> None:
+        # As dense a horde as fits, leaving a quarter of the width to march
+        # in so collisions are checked every frame instead of advancing
+        rows, cols = fitting_horde(game.settings)
+        game.settings.horde_size = (rows - 1, cols * 3 // 4)
+        game.horde.reset()
+        _start_playing(game)
+
+
+def _mass_kill_frame(game: AlienInvasion, frame: int, kills_per_frame: int = 6) -> None:
+        # A cleared wave respawns the horde; skip its descent untimed and keep killing
+        if game.horde.state.spawning or game.state != GameState.PLAYING:
+                _run_until(game, lambda g: g.state == GameState.PLAYING and not g.horde.state.spawning)
+
+        # Place a laser on top of the next few aliens so they die this frame
+        for rect in game.horde.alien_rects()[:kills_per_frame]:
+                game.lasers.add(game.laser_pool.acquire(*rect.center))
+
+
+def _mass_kills_done(game: AlienInvasion) -> bool:
+        # The horde reached the ship or the bottom instead of being shot down
+        return game.stats.lives_left != game.settings.starting_lives or game.horde.state.descent_stage
+
+
+def _setup_lose_screen(game: AlienInvasion) -> None:
+        game.stats.score = 1234
+        game.you_lose = True
+        game.state = GameState.LOSE_SCREEN
+
+
+SCENARIOS: tuple[Scenario, ...] = (
+        Scenario('spawn_descent', _setup_spawn, done=lambda g: g.state != GameState.SPAWNING),
+        Scenario('horizontal_march', _start_playing),
+        Scenario('rapid_fire', _setup_rapid_fire, _rapid_fire_frame),
+        Scenario('mass_kills', _setup_mass_kills, _mass_kill_frame, _mass_kills_done, check=lambda g: g.stats.score > 0),
+        Scenario('lose_screen', _setup_lose_screen),
+)
+
+
+# ---------- Measurement ----------
+
+def _instrument(game: AlienInvasion, timings: dict[str, list[float]]) -> None:
+        """Wrap the hot methods on this game instance with timers."""
+        for label, owner_name, method_name in SECTIONS:
+                owner = getattr(game, owner_name) if owner_name else game
+                method = getattr(owner, method_name)
+                samples = timings.setdefault(label, [])
+
+                def timed(*args, _method=method, _samples=samples, **kwargs):
+                        start = time.perf_counter()
+                        result = _method(*args, **kwargs)
+                        _samples.append((time.perf_counter() - start) * 1000)
+                        return result
+
+                setattr(owner, method_name, timed)
+
+
+def _play(game: AlienInvasion, scenario: Scenario, frames: int) -> list[float]:
+        """Run the timed frames of a scenario and return frame times in ms."""
+        frame_times: list[float] = []
+        for frame in range(frames):
+                if scenario.done and scenario.done(game):
+                        break
+                if scenario.before_frame:
+                        scenario.before_frame(game, frame)
+
+                start = time.perf_counter()
+                game.step()
+                frame_times.append((time.perf_counter() - start) * 1000)
+
+        if scenario.check and not scenario.check(game):
+                raise RuntimeError(f'scenario {scenario.name} did not do what it measures')
+        return frame_times
+
+
+def run_scenario(scenario: Scenario, frames: int, scores_dir: Path, overrides: dict) -> dict:
+        """Time one scenario, then replay it under tracemalloc for allocations."""
+
+        # Timing pass
+        game = new_game(scores_dir, overrides)
+        try:
+                scenario.setup(game)
+                timings: dict[str, list[float]] = {}
+                _instrument(game, timings)
+                frame_times = _play(game, scenario, frames)
+        finally:
+                # Stop the score threads before the scores directory goes away
+                game.stats.close()
+
+        if len(frame_times) < min(frames, MIN_SAMPLES):
+                print(f"warning: {scenario.name} ended after {len(frame_times)} frames; its percentiles are noise", file=sys.stderr)
+
+        total_s = sum(frame_times) / 1000
+        result = {
+                'frames': len(frame_times),
+                'few_samples': len(frame_times) < min(frames, MIN_SAMPLES),
+                'mean_ms': statistics.fmean(frame_times),
+                'p50_ms': percentile(frame_times, 50),
+                'p95_ms': percentile(frame_times, 95),
+                'p99_ms': percentile(frame_times, 99),
+                'max_ms': max(frame_times),
+                'fps': len(frame_times) / total_s if total_s else 0.0,
+                'sections': {
+                        label: {
+                                'mean_ms': statistics.fmean(samples),
+                                'p95_ms': percentile(samples, 95),
+                        }
+                        for label, samples in timings.items() if samples
+                },
+        }
+
+        # Allocation pass (separate so tracing overhead never skews timings)
+        game = new_game(scores_dir, overrides)
+        try:
+                scenario.setup(game)
+                tracemalloc.start()
+                tracemalloc.reset_peak()
+                before, _ = tracemalloc.get_traced_memory()
+                traced_frames = len(_play(game, scenario, frames))
+                after, peak = tracemalloc.get_traced_memory()
+        finally:
+                tracemalloc.stop()
+                game.stats.close()
+
+        result['alloc'] = {
+                'net_kib': (after - before) / 1024,
+                'peak_kib': (peak - before) / 1024,
+                'net_bytes_per_frame': (after - before) / traced_frames if traced_frames else 0.0,
+        }
+        return result
+
+
+def run_benchmarks(frames: int, only: list[str] | None = None, overrides: dict | None = None) -> dict:
+        """Run every (or each selected) scenario and collect a report."""
+        overrides = overrides or {}
+        report = {
+                'meta': {
+                        'python': platform.python_version(),
+                        'pygame': pygame.version.ver,
+                        'machine': platform.machine(),
+                        'frames_per_scenario': frames,
+                        'overrides': {name: str(value) for name, value in overrides.items()},
+                },
+                'scenarios': {},
+        }
+
+        with tempfile.TemporaryDirectory() as scores_dir:
+                for scenario in SCENARIOS:
+                        if only and scenario.name not in only:
+                                continue
+                        report['scenarios'][scenario.name] = run_scenario(scenario, frames, Path(scores_dir), overrides)
+
+        return report
+
+
+def compare(report: dict, baseline: dict, tolerance: float) -> list[str]:
+        """
+        Return a description of every metric that regressed by more than
+        `tolerance` (a fraction) relative to the baseline.
+        """
+        regressions = []
+        for name, current in report['scenarios'].items():
+                previous = baseline.get('scenarios', {}).get(name)
+                if previous is None or current.get('few_samples') or previous.get('few_samples'):
+                        continue
+
+                for metric, higher_is_better in COMPARED_METRICS.items():
+                        old, new = previous[metric], current[metric]
+                        if not old:
+                                continue
+                        change = (new - old) / old
+                        worse = -change if higher_is_better else change
+                        if worse > tolerance:
+                                regressions.append(f"{name}.{metric}: {old:.3f} -> {new:.3f} ({change:+.1%})")
+
+        return regressions
+
+
+def _print_report(report: dict) -> None:
+        print(f"{'scenario':<18}{'frames':>8}{'p50':>9}{'p95':>9}{'p99':>9}{'fps':>10}{'KiB/frame':>11}")
+        for name, result in report['scenarios'].items():
+                print(
+                        f"{name:<18}{result['frames']:>8}"
+                        f"{result['p50_ms']:>9.3f}{result['p95_ms']:>9.3f}{result['p99_ms']:>9.3f}"
+                        f"{result['fps']:>10.0f}{result['alloc']['net_bytes_per_frame'] / 1024:>11.2f}"
+                )
+
+
+def main(argv: list[str] | None = None) -> int:
+        parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+        parser.add_argument('--frames', type=int, default=600, help='timed frames per scenario')
+        parser.add_argument('--scenario', action='append', help='run only the named scenario(s)')
+        parser.add_argument('--output', type=Path, help='write the JSON report here')
+        parser.add_argument('--baseline', type=Path, help='compare against this stored report')
+        parser.add_argument('--save-baseline', type=Path, help='store this run as the new baseline')
+        parser.add_argument('--tolerance', type=float, default=0.10, help='allowed regression fraction')
+        parser.add_argument('--engine', choices=('sprites', 'numpy'), default='sprites', help='horde engine')
+        parser.add_argument('--horde-size', help='rows x columns that fit the screen, e.g. 8x16')
+        parser.add_argument('--dirty-rendering', action='store_true', help='use the dirty-rect renderer')
+        args = parser.parse_args(argv)
+
+        overrides: dict = {'horde_engine': args.engine, 'dirty_rendering': args.dirty_rendering}
+        if args.horde_size:
+                rows, cols = (int(value) for value in args.horde_size.lower().split('x'))
+                overrides['horde_size'] = (rows, cols)
+
+                # Aliens scale with the screen, so a horde that does not fit goes
+                # straight to advancing and descent and never marches
+                max_rows, max_cols = fitting_horde(Settings(headless=True))
+                if rows > max_rows or cols > max_cols:
+                        parser.error(f"--horde-size {rows}x{cols} does not fit the screen (at most {max_rows}x{max_cols})")
+
+        report = run_benchmarks(args.frames, args.scenario, overrides)
+        _print_report(report)
+
+        for path in (args.output, args.save_baseline):
+                if path:
+                        path.write_text(json.dumps(report, indent=4))
+
+        if args.baseline:
+                regressions = compare(report, json.loads(args.baseline.read_text()), args.tolerance)
+                for line in regressions:
+                        print("REGRESSION", line)
+                if regressions:
+                        return 1
+
+        return 0
+
+
+if __name__ == '__main__':
+        sys.exit(main())
@@ -0,0 +1,24 @@
+"""
+Shared helpers for the benchmark scripts: building throwaway headless
+games and summarizing frame times.
+"""
+
+from pathlib import Path
+
+from Alien_Invasion import AlienInvasion
+
+
+def new_game(scores_dir: Path, overrides: dict) -> AlienInvasion:
+        """Build a headless game that never writes to the real score files."""
+        return AlienInvasion(headless=True, overrides={
+                'score_file': scores_dir / 'scores.json',
+                'score_history_file': scores_dir / 'scores.db',
+                **overrides,
+        })
+
+
+def percentile(samples: list[float], pct: float) -> float:
+        """Nearest-rank percentile of a non-empty sample list."""
+        ordered = sorted(samples)
+        index = max(0, min(len(ordered) - 1, round(pct / 100 * len(ordered)) - 1))
+        return ordered[index]
@@ -0,0 +1,200 @@
+"""
+Multi-process Settings sweep for difficulty balancing.
+
+Plays headless games with a scripted bot for every combination of the
+given Settings values, one configuration per worker process, and reports
+the wave survived, score and frame times of each as JSON and/or CSV.
+Configurations share nothing, so throughput scales with the number of
+workers.
+
+Usage (from the project root):
+
+        python -m benchmarks.sweep --param horde_speed=2,3,4 --param horde_size=5x10,6x12
+        python -m benchmarks.sweep --param alien_value=5,10 --games 4 --csv sweep.csv --output sweep.json
+"""
+
+import argparse
+import csv
+import itertools
+import json
+import multiprocessing
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+from Alien_Invasion import AlienInvasion, GameState
+from benchmarks.harness import new_game, percentile
+
+
+def _parse_value(text: str):
+        """Parses '5x10' as a (rows, columns) tuple, then int, then float, else keeps the string."""
+        if 'x' in text and all(part.isdigit() for part in text.split('x')):
+                return tuple(int(part) for part in text.split('x'))
+        for kind in (int, float):
+                try:
+                        return kind(text)
+                except ValueError:
+                        pass
+        return text
+
+
+def parse_grid(params: list[str]) -> list[dict]:
+        """Expands ['name=a,b', ...] into every combination of the values."""
+        names, choices = [], []
+        for param in params:
+                name, _, values = param.partition('=')
+                if not values:
+                        raise ValueError(f"expected name=value[,value...], got {param!r}")
+                names.append(name)
+                choices.append([_parse_value(value) for value in values.split(',')])
+        return [dict(zip(names, combination)) for combination in itertools.product(*choices)]
+
+
+def _bot(game: AlienInvasion, rng: random.Random) -> None:
+        """Chases one of the lowest aliens and fires once it is lined up."""
+        ship = game.ship_group.sprite
+        aliens = game.horde.alien_rects()
+        if not ship or not aliens:
+                return
+
+        lowest = max(rect.bottom for rect in aliens)
+        targets = [rect for rect in aliens if rect.bottom == lowest]
+        target = min(targets, key=lambda rect: abs(rect.centerx - ship.rect.centerx) + rng.random())
+
+        offset = target.centerx - ship.rect.centerx
+        ship.state.moving_right = offset > ship.rect.width // 4
+        ship.state.moving_left = offset < -ship.rect.width // 4
+        ship.state.firing = True
+        ship.state.firing_rapid = abs(offset) < ship.rect.width
+
+
+def play_game(overrides: dict, seed: int, max_ticks: int, scores_dir: Path) -> dict:
+        """Plays one bot game until it is lost or `max_ticks` pass."""
+        game = new_game(scores_dir, overrides)
+        game.paused = False
+        rng = random.Random(seed)
+
+        frame_times: list[float] = []
+        while game.tick_count < max_ticks and game.state not in (GameState.LOSE_DELAY, GameState.LOSE_SCREEN):
+                if game.allow_player_input:
+                        _bot(game, rng)
+
+                start = time.perf_counter()
+                game.step()
+                frame_times.append((time.perf_counter() - start) * 1000)
+
+        stats = game.stats
+        stats.close()
+        return {
+                'wave': stats.wave,
+                'score': stats.score,
+                'ticks': game.tick_count,
+                'lost': game.state in (GameState.LOSE_DELAY, GameState.LOSE_SCREEN),
+                'accuracy': stats.hits / stats.shots_fired if stats.shots_fired else 0.0,
+                'frame_times': frame_times,
+        }
+
+
+def run_config(config: dict, games: int, max_ticks: int, seed: int) -> dict:
+        """Worker entry point: plays `games` games of one configuration and aggregates them."""
+        with tempfile.TemporaryDirectory() as scores_dir:
+                results = [play_game(config, seed + game, max_ticks, Path(scores_dir)) for game in range(games)]
+
+        frame_times = [ms for result in results for ms in result['frame_times']]
+        total_s = sum(frame_times) / 1000
+        return {
+                'config': config,
+                'games': games,
+                'wave_mean': statistics.fmean(result['wave'] for result in results),
+                'wave_max': max(result['wave'] for result in results),
+                'score_mean': statistics.fmean(result['score'] for result in results),
+                'score_max': max(result['score'] for result in results),
+                'ticks_mean': statistics.fmean(result['ticks'] for result in results),
+                'losses': sum(result['lost'] for result in results),
+                'accuracy_mean': statistics.fmean(result['accuracy'] for result in results),
+                'p50_ms': percentile(frame_times, 50),
+                'p95_ms': percentile(frame_times, 95),
+                'p99_ms': percentile(frame_times, 99),
+                'max_ms': max(frame_times),
+                'fps': len(frame_times) / total_s if total_s else 0.0,
+        }
+
+
+def run_sweep(grid: list[dict], games: int, max_ticks: int, seed: int, workers: int | None = None) -> dict:
+        """Fans the configurations out over a process pool; results keep grid order."""
+        workers = min(len(grid), workers or os.cpu_count() or 1)
+        start = time.perf_counter()
+
+        # Each worker imports pygame fresh; a forked child would inherit the parent's SDL state
+        results: list[dict | None] = [None] * len(grid)
+        with ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context('spawn')) as executor:
+                futures = {
+                        executor.submit(run_config, config, games, max_ticks, seed): index
+                        for index, config in enumerate(grid)
+                }
+                for done, future in enumerate(as_completed(futures), 1):
+                        results[futures[future]] = future.result()
+                        print(f"[{done}/{len(grid)}] {grid[futures[future]]}", file=sys.stderr)
+
+        return {
+                'meta': {
+                        'workers': workers,
+                        'games_per_config': games,
+                        'max_ticks': max_ticks,
+                        'seed': seed,
+                        'wall_s': time.perf_counter() - start,
+                },
+                'results': results,
+        }
+
+
+def write_csv(report: dict, path: Path) -> None:
+        """One row per configuration, with each swept Settings value as its own column."""
+        rows = [{**result['config'], **{k: v for k, v in result.items() if k != 'config'}} for result in report['results']]
+        with open(path, 'w', newline='') as file:
+                writer = csv.DictWriter(file, fieldnames=list(rows[0]))
+                writer.writeheader()
+                writer.writerows(rows)
+
+
+def _print_report(report: dict) -> None:
+        print(f"{'config':<40}{'wave':>7}{'score':>9}{'ticks':>9}{'p95':>8}{'fps':>8}")
+        for result in report['results']:
+                config = ' '.join(f"{name}={value}" for name, value in result['config'].items())
+                print(
+                        f"{config:<40}{result['wave_mean']:>7.1f}{result['score_mean']:>9.0f}"
+                        f"{result['ticks_mean']:>9.0f}{result['p95_ms']:>8.2f}{result['fps']:>8.0f}"
+                )
+        meta = report['meta']
+        print(f"{len(report['results'])} configs on {meta['workers']} workers in {meta['wall_s']:.1f}s")
+
+
+def main(argv: list[str] | None = None) -> int:
+        parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+        parser.add_argument('--param', action='append', required=True, help='Settings name=value[,value...]')
+        parser.add_argument('--games', type=int, default=1, help='bot games per configuration')
+        parser.add_argument('--max-ticks', type=int, default=20_000, help='ticks before a game is cut off')
+        parser.add_argument('--seed', type=int, default=0, help='seed for the bot')
+        parser.add_argument('--workers', type=int, help='worker processes (default: one per core)')
+        parser.add_argument('--output', type=Path, help='write the JSON report here')
+        parser.add_argument('--csv', type=Path, help='write a CSV report here')
+        args = parser.parse_args(argv)
+
+        report = run_sweep(parse_grid(args.param), args.games, args.max_ticks, args.seed, args.workers)
+        _print_report(report)
+
+        if args.output:
+                args.output.write_text(json.dumps(report, indent=4))
+        if args.csv:
+                write_csv(report, args.csv)
+
+        return 0
+
+
+if __name__ == '__main__':
+        sys.exit(main())
@@ -0,0 +1,75 @@
+"""
+Column-bucket collision index for the alien horde.
+
+The horde is laid out on a fixed grid and only ever moves as one rigid
+block, so each alien stays in the same column for its whole life. Bucketing
+aliens by column lets a laser be tested only against the aliens in the
+column(s) it overlaps instead of against the whole horde.
+"""
+
+import pygame
+
+
+class ColumnIndex:
+        """
+        Buckets sprites by horde column.
+
+        `origin_x` is the left edge of column 0 and `pitch` is the width of a
+        column (alien width plus padding). Call `shift` whenever the horde moves
+        sideways so the columns keep tracking the sprites.
+        """
+
+        def __init__(self, pitch: int, origin_x: int = 0) -> None:
+                self.pitch = pitch
+                self.origin_x = origin_x
+                self.columns: dict[int, list[pygame.sprite.Sprite]] = {}
+                self._column_of: dict[pygame.sprite.Sprite, int] = {}
+
+        def add(self, sprite: pygame.sprite.Sprite, column: int) -> None:
+                self.columns.setdefault(column, []).append(sprite)
+                self._column_of[sprite] = column
+
+        def remove(self, sprite: pygame.sprite.Sprite) -> None:
+                column = self._column_of.pop(sprite, None)
+                if column is not None:
+                        self.columns[column].remove(sprite)
+                        if not self.columns[column]:
+                                del self.columns[column]
+
+        def clear(self) -> None:
+                self.columns.clear()
+                self._column_of.clear()
+
+        def shift(self, dx: int) -> None:
+                """Moves every column sideways by `dx` pixels."""
+                self.origin_x += dx
+
+        def candidates(self, rect: pygame.Rect) -> list[pygame.sprite.Sprite]:
+                """Returns the sprites in every column `rect` overlaps."""
+                first = (rect.left - self.origin_x) // self.pitch
+                last = (rect.right - 1 - self.origin_x) // self.pitch
+
+                found = []
+                for column in range(first, last + 1):
+                        found.extend(self.columns.get(column, ()))
+                return found
+
+        def collide(self, other: pygame.sprite.Group) -> dict[pygame.sprite.Sprite, list[pygame.sprite.Sprite]]:
+                """
+                Finds indexed sprites hit by sprites in `other`, in the same
+                {indexed: [others]} shape as pygame.sprite.groupcollide. Each sprite
+                in `other` hits at most one indexed sprite. Nothing is killed.
+                """
+                collisions: dict[pygame.sprite.Sprite, list[pygame.sprite.Sprite]] = {}
+
+                for sprite in other:
+                        for target in self.candidates(sprite.rect):
+                                if sprite.rect.colliderect(target.rect):
+                                        collisions.setdefault(target, []).append(sprite)
+                                        break
+
+                return collisions
+
+        def any_collide(self, rect: pygame.Rect) -> bool:
+                """True if `rect` overlaps any indexed sprite."""
+                return any(rect.colliderect(target.rect) for target in self.candidates(rect))
@@ -0,0 +1,281 @@
+"""
+Gym-style environments for training agents on Alien Invasion.
+
+AlienInvasionEnv wraps one headless game that is stepped directly, one
+simulation tick per action, without the event loop or a display. Actions
+are the ShipState input bits (bit 0 right, 1 left, 2 fire, 3 rapid fire,
+so 16 actions). Observations are either a flat state vector or a
+downsampled RGB frame. VectorEnv batches N environments in one process and
+ProcessVectorEnv spreads them across worker processes. Requires NumPy.
+"""
+
+from multiprocessing.connection import Connection
+from pathlib import Path
+from typing import TYPE_CHECKING
+import multiprocessing
+import tempfile
+import numpy as np
+import pygame
+
+
+# Forward reference to avoid circular imports at runtime
+if TYPE_CHECKING:
+        from Alien_Invasion import AlienInvasion
+
+
+# Number of distinct actions (every combination of the four input bits)
+ACTIONS: int = 16
+
+OBSERVATIONS: tuple[str, ...] = ('state', 'pixels')
+
+
+class AlienInvasionEnv:
+        """
+        One headless game behind reset() and step(action).
+
+        State observations are float32 vectors, normalized to the screen size:
+        ship (x, y), then (x, y, alive) for every alien slot, then (x, y, active)
+        for every laser slot. Living aliens and lasers are packed first; unused
+        slots are zero. Rewards are the score gained during the step.
+        """
+
+        def __init__(
+                self,
+                observation: str = 'state',
+                frame_size: tuple[int, int] = (84, 84),
+                frame_skip: int = 1,
+                max_steps: int | None = None,
+                skip_spawn: bool = True,
+                overrides: dict | None = None
+        ) -> None:
+                if observation not in OBSERVATIONS:
+                        raise ValueError(f"observation must be one of {OBSERVATIONS}, not {observation!r}")
+
+                # Imported here so worker processes only load the game once they build one
+                from Alien_Invasion import AlienInvasion
+
+                self.observation = observation
+                self.frame_size = frame_size
+                self.frame_skip = frame_skip
+                self.max_steps = max_steps
+                self.skip_spawn = skip_spawn
+
+                # Score files go to a scratch directory so training never touches real scores
+                self._scratch = tempfile.TemporaryDirectory(prefix='alien-env-')
+                scratch = Path(self._scratch.name)
+                self.game: 'AlienInvasion' = AlienInvasion(headless=True, uncapped=True, overrides={
+                        'score_file': scratch / 'scores.json',
+                        'score_history_file': scratch / 'scores.db',
+                        **(overrides or {}),
+                })
+
+                width, height = self.game.settings.screen_size
+                self._scale = np.array([width, height], dtype=np.float32)
+
+                # Fixed slot counts so every observation has the same shape
+                rows, cols = self.game.settings.horde_size
+                self.alien_slots: int = (rows * cols + 1) // 2
+                self.laser_slots: int = self.game.settings.laser_pool_size
+
+                self.steps: int = 0
+
+        @property
+        def observation_shape(self) -> tuple[int, ...]:
+                if self.observation == 'pixels':
+                        return (self.frame_size[1], self.frame_size[0], 3)
+                return (2 + 3 * self.alien_slots + 3 * self.laser_slots,)
+
+        def _game_over(self) -> bool:
+                from Alien_Invasion import GameState
+                return self.game.state in (GameState.LOSE_DELAY, GameState.LOSE_SCREEN)
+
+        def _slots(self, rects: list[pygame.Rect], count: int) -> np.ndarray:
+                """(x, y, present) rows for up to `count` rect centers, zero padded."""
+                slots = np.zeros((count, 3), dtype=np.float32)
+                centers = [rect.center for rect in rects[:count]]
+                if centers:
+                        slots[:len(centers), :2] = np.array(centers, dtype=np.float32) / self._scale
+                        slots[:len(centers), 2] = 1.0
+                return slots.ravel()
+
+        def _observe(self) -> np.ndarray:
+                game = self.game
+
+                if self.observation == 'pixels':
+                        game._update_screen()
+                        frame = pygame.transform.smoothscale(game.screen, self.frame_size)
+                        # surfarray is (x, y, rgb); observations are (row, column, rgb)
+                        return pygame.surfarray.array3d(frame).transpose(1, 0, 2)
+
+                ship = game.ship_group.sprite
+                ship_position = np.array(ship.rect.center if ship else (0, 0), dtype=np.float32) / self._scale
+                return np.concatenate((
+                        ship_position,
+                        self._slots(game.horde.alien_rects(), self.alien_slots),
+                        self._slots([shot.rect for shot in game.lasers], self.laser_slots),
+                ))
+
+        def _info(self) -> dict:
+                stats = self.game.stats
+                return {
+                        'score': stats.score,
+                        'wave': stats.wave,
+                        'lives': stats.lives_left,
+                        'steps': self.steps,
+                        'truncated': self.max_steps is not None and self.steps >= self.max_steps,
+                }
+
+        def reset(self) -> np.ndarray:
+                """Starts a new game and returns its first observation."""
+                from Alien_Invasion import GameState
+
+                game = self.game
+                game.restart_game()
+                game.settings.horde_direction = 1
+                game.paused = False
+                self.steps = 0
+
+                # Spawning and the ready hold take no input, so skip them
+                if self.skip_spawn:
+                        while game.state != GameState.PLAYING:
+                                game._simulate()
+
+                return self._observe()
+
+        def step(self, action: int) -> tuple[np.ndarray, float, bool, dict]:
+                """Applies `action` for `frame_skip` ticks; returns (observation, reward, done, info)."""
+                game = self.game
+                score = game.stats.score
+
+                for _ in range(self.frame_skip):
+                        game.ship.state.apply_bits(int(action))
+                        game._simulate()
+                        if self._game_over():
+                                break
+
+                self.steps += 1
+                info = self._info()
+                done = self._game_over() or info['truncated']
+                return self._observe(), float(game.stats.score - score), done, info
+
+        def close(self) -> None:
+                """Stops the game's background score threads and removes the scratch directory."""
+                self.game.stats.close()
+                self._scratch.cleanup()
+
+
+class VectorEnv:
+        """
+        N independent environments stepped as a batch in this process.
+
+        Finished environments reset themselves; their last observation is
+        kept in info['final_observation'].
+        """
+
+        def __init__(self, count: int, **kwargs) -> None:
+                self.envs: list[AlienInvasionEnv] = [AlienInvasionEnv(**kwargs) for _ in range(count)]
+
+        def __len__(self) -> int:
+                return len(self.envs)
+
+        def reset(self) -> np.ndarray:
+                return np.stack([env.reset() for env in self.envs])
+
+        def step(self, actions) -> tuple[np.ndarray, np.ndarray, np.ndarray, list[dict]]:
+                observations, rewards, dones, infos = [], [], [], []
+
+                for env, action in zip(self.envs, actions):
+                        observation, reward, done, info = env.step(action)
+                        if done:
+                                info['final_observation'] = observation
+                                observation = env.reset()
+                        observations.append(observation)
+                        rewards.append(reward)
+                        dones.append(done)
+                        infos.append(info)
+
+                return (
+                        np.stack(observations),
+                        np.array(rewards, dtype=np.float32),
+                        np.array(dones, dtype=bool),
+                        infos
+                )
+
+        def close(self) -> None:
+                for env in self.envs:
+                        env.close()
+
+
+def _worker(connection: Connection, count: int, kwargs: dict) -> None:
+        """Hosts a VectorEnv in a worker process and serves commands from the pipe."""
+        envs = VectorEnv(count, **kwargs)
+        try:
+                while True:
+                        command, data = connection.recv()
+                        if command == 'reset':
+                                connection.send(envs.reset())
+                        elif command == 'step':
+                                connection.send(envs.step(data))
+                        elif command == 'close':
+                                break
+        finally:
+                envs.close()
+                connection.close()
+
+
+class ProcessVectorEnv:
+        """
+        N environments split across worker processes, stepped as one batch.
+
+        Each worker runs a VectorEnv over its share of the environments, so a
+        batched step costs one pipe round trip per worker rather than per
+        environment.
+        """
+
+        def __init__(self, count: int, workers: int | None = None, **kwargs) -> None:
+                workers = min(count, workers or multiprocessing.cpu_count())
+
+                # Spread environments as evenly as possible
+                self.counts: list[int] = [count // workers + (i < count % workers) for i in range(workers)]
+
+                # Spawned rather than forked: pygame state must not be shared
+                context = multiprocessing.get_context('spawn')
+                self.connections: list[Connection] = []
+                self.processes: list[multiprocessing.Process] = []
+                for share in self.counts:
+                        parent, child = context.Pipe()
+                        process = context.Process(target=_worker, args=(child, share, kwargs), daemon=True)
+                        process.start()
+                        child.close()
+                        self.connections.append(parent)
+                        self.processes.append(process)
+
+        def __len__(self) -> int:
+                return sum(self.counts)
+
+        def reset(self) -> np.ndarray:
+                for connection in self.connections:
+                        connection.send(('reset', None))
+                return np.concatenate([connection.recv() for connection in self.connections])
+
+        def step(self, actions) -> tuple[np.ndarray, np.ndarray, np.ndarray, list[dict]]:
+                # Send every worker its slice first so they all step at once
+                start = 0
+                for connection, share in zip(self.connections, self.counts):
+                        connection.send(('step', list(actions[start:start + share])))
+                        start += share
+
+                results = [connection.recv() for connection in self.connections]
+                return (
+                        np.concatenate([observations for observations, _, _, _ in results]),
+                        np.concatenate([rewards for _, rewards, _, _ in results]),
+                        np.concatenate([dones for _, _, dones, _ in results]),
+                        [info for _, _, _, infos in results for info in infos]
+                )
+
+        def close(self) -> None:
+                for connection in self.connections:
+                        connection.send(('close', None))
+                        connection.close()
+                for process in self.processes:
+                        process.join()
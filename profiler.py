@@ -0,0 +1,232 @@
+"""
+Frame profiler, debug overlay and startup timing for Alien Invasion.
+
+Times the hot subsystems of every frame with rolling averages and
+worst-frame capture, and can draw the numbers over the game. When disabled
+nothing is wrapped, so the only cost left in the loop is one attribute check
+per frame. StartupTimer breaks game construction into phases and records
+the time to the first finished frame.
+"""
+
+from collections import deque
+from typing import TYPE_CHECKING
+import time
+import pygame
+
+
+# Forward reference to avoid circular imports at runtime
+if TYPE_CHECKING:
+        from Alien_Invasion import AlienInvasion
+
+
+# Timed methods, as (label, owner attribute on the game, method name).
+# horde.update includes the nested collisions timing.
+SECTIONS: tuple[tuple[str, str, str], ...] = (
+        ('events', '', '_event_listener'),
+        ('horde.update', 'horde', 'update'),
+        ('collisions', 'horde', '_check_collisions'),
+        ('ship.update', 'ship_group', 'update'),
+        ('lasers.update', 'lasers', 'update'),
+        ('hud.draw', 'hud', 'draw'),
+        ('display.flip', '', '_flip'),
+)
+
+
+class StartupTimer:
+        """Wall-clock time of each startup phase, plus the time to first frame."""
+
+        def __init__(self) -> None:
+                self.start: float = time.perf_counter()
+                self._last: float = self.start
+                self.phases: dict[str, float] = {}
+                self.first_frame_ms: float | None = None
+
+        def mark(self, phase: str) -> None:
+                """Ends `phase`, which ran from the previous mark until now."""
+                now = time.perf_counter()
+                self.phases[phase] = (now - self._last) * 1000
+                self._last = now
+
+        def first_frame(self) -> None:
+                self.first_frame_ms = (time.perf_counter() - self.start) * 1000
+
+        def report(self) -> str:
+                lines = [f"{phase:<14}{ms:8.1f} ms" for phase, ms in self.phases.items()]
+                lines.append(f"{'total':<14}{sum(self.phases.values()):8.1f} ms")
+                if self.first_frame_ms is not None:
+                        lines.append(f"{'first frame':<14}{self.first_frame_ms:8.1f} ms")
+                return "\n".join(lines)
+
+
+class FrameProfiler:
+        """
+        Per-subsystem frame timing with an optional on-screen overlay.
+
+        Enabling wraps each section's method on its instance with a timer;
+        disabling removes the wrappers again.
+        """
+
+        def __init__(self, game: 'AlienInvasion', window: int = 120, refresh_ms: int = 250) -> None:
+                self.game = game
+                self.window = window
+                self.refresh_ms = refresh_ms
+                self.enabled: bool = False
+
+                # Time spent per section in the frame being measured
+                self._current: dict[str, float] = {label: 0.0 for label, _, _ in SECTIONS}
+
+                # Rolling history (ms) per section and for whole frames
+                self.history: dict[str, deque[float]] = {label: deque(maxlen=window) for label, _, _ in SECTIONS}
+                self.frame_times: deque[float] = deque(maxlen=window)
+                self.worst: dict | None = None
+
+                self._frame_start: float = 0.0
+                self._wrapped: list[tuple[object, str]] = []
+
+                # Overlay text is only re-rendered every `refresh_ms`
+                self._overlay: pygame.Surface | None = None
+                self._overlay_updated: float = 0.0
+
+        # ---------- Instrumentation ----------
+
+        def _timed(self, label: str, method):
+                current = self._current
+                perf_counter = time.perf_counter
+
+                def timed(*args, **kwargs):
+                        start = perf_counter()
+                        try:
+                                return method(*args, **kwargs)
+                        finally:
+                                current[label] += (perf_counter() - start) * 1000
+
+                return timed
+
+        def enable(self) -> None:
+                if self.enabled:
+                        return
+
+                for label, owner_name, method_name in SECTIONS:
+                        owner = getattr(self.game, owner_name) if owner_name else self.game
+                        setattr(owner, method_name, self._timed(label, getattr(owner, method_name)))
+                        self._wrapped.append((owner, method_name))
+
+                self.enabled = True
+                self._frame_start = time.perf_counter()
+
+        def disable(self) -> None:
+                if not self.enabled:
+                        return
+
+                # Dropping the instance attribute uncovers the class method again
+                for owner, method_name in self._wrapped:
+                        delattr(owner, method_name)
+                self._wrapped.clear()
+
+                self.enabled = False
+                self._overlay = None
+
+        def toggle(self) -> None:
+                self.disable() if self.enabled else self.enable()
+
+        def begin_frame(self) -> None:
+                """
+                Starts timing a frame. Call at the top of the frame, after any
+                idle wait, so frame times cover only the work and never the
+                frame cap's sleep.
+                """
+                self._frame_start = time.perf_counter()
+
+        def end_frame(self) -> None:
+                """Closes the current frame's measurements. Call once per frame while enabled, before the frame cap."""
+                frame_ms = (time.perf_counter() - self._frame_start) * 1000
+
+                self.frame_times.append(frame_ms)
+                for label, spent in self._current.items():
+                        self.history[label].append(spent)
+
+                if self.worst is None or frame_ms > self.worst['frame_ms']:
+                        self.worst = {
+                                'frame': self.game.frame_count,
+                                'frame_ms': frame_ms,
+                                'sections': dict(self._current),
+                        }
+
+                for label in self._current:
+                        self._current[label] = 0.0
+
+        # ---------- Metrics API ----------
+
+        def counts(self) -> dict[str, int]:
+                return {
+                        'aliens': len(self.game.horde),
+                        'lasers': len(self.game.lasers),
+                        'pool_free': len(self.game.laser_pool.free),
+                        'pool_high_water': self.game.laser_pool.high_water,
+                }
+
+        def snapshot(self) -> dict:
+                """Rolling averages and maxima per section, plus the worst frame seen."""
+                def summary(samples: deque[float]) -> dict[str, float]:
+                        if not samples:
+                                return {'avg_ms': 0.0, 'max_ms': 0.0}
+                        return {'avg_ms': sum(samples) / len(samples), 'max_ms': max(samples)}
+
+                frame = summary(self.frame_times)
+                return {
+                        'fps': self.game.clock.get_fps(),
+                        # Frame rate the work alone would allow with no cap
+                        'uncapped_fps': 1000 / frame['avg_ms'] if frame['avg_ms'] else 0.0,
+                        'frame': frame,
+                        'sections': {label: summary(samples) for label, samples in self.history.items()},
+                        'worst': self.worst,
+                        'counts': self.counts(),
+                }
+
+        def reset(self) -> None:
+                """Forgets all history and the worst frame."""
+                for samples in self.history.values():
+                        samples.clear()
+                self.frame_times.clear()
+                self.worst = None
+
+        # ---------- Overlay ----------
+
+        def _render_overlay(self) -> pygame.Surface:
+                settings = self.game.settings
+                font = self.game.font_manager.get(settings.hi_score_font, max(12, settings.screen_size[1] // 50))
+                metrics = self.snapshot()
+
+                lines = [
+                        f"fps {metrics['fps']:.0f}  uncapped {metrics['uncapped_fps']:.0f}",
+                        f"frame {metrics['frame']['avg_ms']:.2f} / {metrics['frame']['max_ms']:.2f} ms",
+                ]
+                lines += [
+                        f"{label} {summary['avg_ms']:.2f} / {summary['max_ms']:.2f}"
+                        for label, summary in metrics['sections'].items()
+                ]
+                if metrics['worst']:
+                        lines.append(f"worst #{metrics['worst']['frame']} {metrics['worst']['frame_ms']:.2f} ms")
+                lines.append("  ".join(f"{name} {value}" for name, value in metrics['counts'].items()))
+
+                # Values change every refresh, so render directly instead of caching
+                rendered = [font.render(line, False, "white") for line in lines]
+                height = font.get_linesize()
+                surface = pygame.Surface(
+                        (max(line.get_width() for line in rendered) + 8, height * len(rendered) + 8),
+                        pygame.SRCALPHA
+                )
+                surface.fill((0, 0, 0, 160))
+                for row, line in enumerate(rendered):
+                        surface.blit(line, (4, 4 + row * height))
+                return surface
+
+        def draw(self, surface: pygame.Surface) -> pygame.Rect:
+                """Draws the overlay and returns the rect it covered."""
+                now = time.perf_counter() * 1000
+                if self._overlay is None or now - self._overlay_updated >= self.refresh_ms:
+                        self._overlay = self._render_overlay()
+                        self._overlay_updated = now
+
+                settings = self.game.settings
+                return surface.blit(self._overlay, (settings.life_display_loc[0], settings.screen_size[1] // 6))
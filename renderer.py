@@ -0,0 +1,123 @@
+"""
+Batched and dirty-rect rendering for Alien Invasion.
+
+BatchGroup keeps each sprite layer's blit sequence between frames so a
+layer costs one Surface.blits call. Instead of blitting the full-screen
+background and flipping the whole display every frame, DirtyRenderer only
+restores and pushes the regions the ship, lasers, aliens and HUD touched.
+"""
+
+from typing import TYPE_CHECKING
+import pygame
+
+
+# Forward reference to avoid circular imports at runtime
+if TYPE_CHECKING:
+        from Alien_Invasion import AlienInvasion
+
+
+class BatchGroup(pygame.sprite.Group):
+        """
+        Sprite group drawn with a single Surface.blits call.
+
+        The (image, rect) sequence is built once and reused until a sprite is
+        added or removed. Sprites keep their rect objects and move them in
+        place, so the cached sequence always holds current positions. Sprites
+        must not swap their image while in the group.
+        """
+
+        def __init__(self, *sprites) -> None:
+                self._batch: list[tuple[pygame.Surface, pygame.Rect]] | None = None
+                super().__init__(*sprites)
+
+        def add_internal(self, sprite, layer=None) -> None:
+                super().add_internal(sprite, layer)
+                self._batch = None
+
+        def remove_internal(self, sprite) -> None:
+                super().remove_internal(sprite)
+                self._batch = None
+
+        def batch(self) -> list[tuple[pygame.Surface, pygame.Rect]]:
+                if self._batch is None:
+                        self._batch = [(sprite.image, sprite.rect) for sprite in self.spritedict]
+                return self._batch
+
+        def draw(self, surface: pygame.Surface, offset: tuple[int, int] = (0, 0), rects: bool = True) -> list[pygame.Rect] | None:
+                """
+                Blits every sprite (shifted by `offset`) in one call. Returns copies
+                of the rects drawn, or None when `rects` is False.
+                """
+                batch = self.batch()
+                if offset != (0, 0):
+                        batch = [(image, rect.move(offset)) for image, rect in batch]
+                return surface.blits(batch, rects)
+
+
+class DirtyRenderer:
+        """
+        Restores, redraws and pushes only the regions that changed.
+
+        Works like pygame's RenderUpdates/clear pair, but across every layer at
+        once (including hordes drawn straight from arrays): last frame's rects
+        are restored from the background, everything is drawn again, and only
+        the rects that moved or changed are pushed with display.update.
+        """
+
+        def __init__(self, game: 'AlienInvasion') -> None:
+                self.game = game
+                self.screen: pygame.Surface = game.screen
+                self.background: pygame.Surface = game.sky_image
+
+                # Rects drawn last frame, split so static sprites are not re-pushed
+                self._sprite_rects: list[pygame.Rect] = []
+                self._hud_rects: list[pygame.Rect] = []
+                self._overlay_rects: list[pygame.Rect] = []
+
+                # Next frame must repaint and push the whole screen
+                self._full_redraw: bool = True
+
+        def invalidate(self) -> None:
+                """Forces a full repaint on the next frame."""
+                self._full_redraw = True
+
+        def _draw_group(self, group: pygame.sprite.AbstractGroup, offset: tuple[int, int] = (0, 0)) -> list[pygame.Rect]:
+                return self.screen.blits([(sprite.image, sprite.rect.move(offset)) for sprite in group])
+
+        def draw(self) -> None:
+                """Renders one frame and presents only what changed."""
+                game = self.game
+
+                # Restore the background under everything drawn last frame
+                if self._full_redraw:
+                        self.screen.blit(self.background, (0, 0))
+                else:
+                        for rect in self._sprite_rects + self._hud_rects + self._overlay_rects:
+                                self.screen.blit(self.background, rect, rect)
+
+                # Draw every layer, keeping the rects each one covered
+                ship_offset, laser_offset, horde_offset = game._render_offsets()
+                sprite_rects = self._draw_group(game.ship_group, ship_offset)
+                sprite_rects += game.lasers.draw(self.screen, laser_offset)
+                sprite_rects += game.horde.draw(self.screen, horde_offset)
+                hud_rects = game.hud.draw(self.screen)
+                overlay_rects = [game.profiler.draw(self.screen)] if game.profiler.enabled else []
+
+                if self._full_redraw:
+                        game._flip()
+                        self._full_redraw = False
+                else:
+                        # Sprites that did not move and unchanged HUD elements
+                        # redraw to identical pixels, so only push what changed
+                        dirty = list(game.hud.dirty_rects)
+
+                        # The profiler overlay is small, so push it whenever shown,
+                        # and its old area once more after it is hidden
+                        dirty += overlay_rects + self._overlay_rects
+                        if sprite_rects != self._sprite_rects:
+                                dirty += sprite_rects + self._sprite_rects
+                        game._flip(dirty)
+
+                self._sprite_rects = sprite_rects
+                self._hud_rects = hud_rects
+                self._overlay_rects = overlay_rects
@@ -0,0 +1,276 @@
+"""
+Deterministic input recording and replay for Alien Invasion.
+
+The simulation only depends on its settings and on the player's input at
+each fixed tick, so a session is stored as that input: one byte per tick
+(the ShipState flags, the pause state and restarts), run-length encoded,
+behind a header with the RNG seed and a Settings snapshot. Playback runs
+headless and uncapped and checks a digest of the final game state, so a
+replay doubles as a regression test for the horde and collision code and
+as a way to reproduce frame-time spikes under the profiler.
+
+Usage: python replay.py <file> [--profile]
+"""
+
+from dataclasses import dataclass, field, fields
+from pathlib import Path
+from typing import TYPE_CHECKING
+import argparse
+import json
+import random
+import struct
+import tempfile
+import time
+import zlib
+
+
+# Forward reference to avoid circular imports at runtime
+if TYPE_CHECKING:
+        from Alien_Invasion import AlienInvasion
+        from settings import Settings
+
+
+MAGIC = b'AIRP'
+VERSION = 1
+
+# Magic, version, seed, settings JSON length
+HEADER = struct.Struct('<4sBQI')
+# Run length, input bits
+RUN = struct.Struct('<HB')
+# Ticks, final state digest, CRC32 of everything before the footer
+FOOTER = struct.Struct('<III')
+
+# Input bits beyond the ShipState flags (bits 0-3)
+PAUSED = 1 << 4
+RESTART = 1 << 5
+
+# Settings that describe the machine or its files, not the simulation
+HOST_SETTINGS = frozenset({
+        'headless', 'headless_screen_size', 'uncapped', 'fps', 'interpolate', 'dirty_rendering',
+        'profiler', 'profiler_window', 'text_cache_size', 'asset_cache', 'texture_atlas', 'score_file',
+        'score_save_interval', 'score_history_file', 'record_replay', 'report_startup', 'lose_screen_wake_ms',
+})
+
+
+def settings_snapshot(settings: 'Settings') -> dict:
+        """JSON-ready copy of every Settings value that affects the simulation."""
+        snapshot = {}
+        for f in fields(settings):
+                if f.name in HOST_SETTINGS:
+                        continue
+                value = getattr(settings, f.name)
+                snapshot[f.name] = str(value) if isinstance(value, Path) else value
+        return snapshot
+
+
+def settings_overrides(snapshot: dict, settings: 'Settings') -> dict:
+        """Turns a snapshot back into Settings overrides, restoring paths and tuples."""
+        overrides = {}
+        for name, value in snapshot.items():
+                current = getattr(settings, name, None)
+                if isinstance(current, Path):
+                        value = Path(value)
+                elif isinstance(current, tuple):
+                        value = tuple(value)
+                overrides[name] = value
+        return overrides
+
+
+def state_digest(game: 'AlienInvasion') -> int:
+        """CRC32 of everything the simulation decides: stats, state and every sprite position."""
+        stats = game.stats
+        state = (
+                game.state.name, game.paused, game.you_lose, game.sim_time,
+                stats.score, stats.wave, stats.lives_left, stats.shots_fired, stats.hits,
+                tuple(game.ship_group.sprite.rect) if game.ship_group.sprite else None,
+                sorted(tuple(shot.rect) for shot in game.lasers),
+                sorted(tuple(rect) for rect in game.horde.alien_rects()),
+        )
+        return zlib.crc32(repr(state).encode())
+
+
+@dataclass
+class Replay:
+        """Holds a recorded session: seed, settings and run-length encoded input."""
+        seed: int
+        settings: dict
+        runs: list[list[int]] = field(default_factory=list)
+        ticks: int = 0
+        digest: int = 0
+
+        def append(self, bits: int) -> None:
+                if self.runs and self.runs[-1][1] == bits and self.runs[-1][0] < 0xFFFF:
+                        self.runs[-1][0] += 1
+                else:
+                        self.runs.append([1, bits])
+                self.ticks += 1
+
+        def inputs(self):
+                """Yields the input bits for every tick in order."""
+                for length, bits in self.runs:
+                        for _ in range(length):
+                                yield bits
+
+        def save(self, path: Path) -> None:
+                settings = json.dumps(self.settings).encode()
+                data = HEADER.pack(MAGIC, VERSION, self.seed, len(settings)) + settings
+                data += struct.pack('<I', len(self.runs))
+                data += b''.join(RUN.pack(length, bits) for length, bits in self.runs)
+                data += FOOTER.pack(self.ticks, self.digest, zlib.crc32(data))
+                path.write_bytes(data)
+
+        @classmethod
+        def load(cls, path: Path) -> 'Replay':
+                data = path.read_bytes()
+                body, footer = data[:-FOOTER.size], data[-FOOTER.size:]
+                ticks, digest, checksum = FOOTER.unpack(footer)
+                if zlib.crc32(body) != checksum:
+                        raise ValueError(f"Corrupt replay file: {path}")
+
+                magic, version, seed, settings_length = HEADER.unpack_from(body)
+                if magic != MAGIC or version != VERSION:
+                        raise ValueError(f"Not a version {VERSION} replay file: {path}")
+
+                offset = HEADER.size
+                settings = json.loads(body[offset:offset + settings_length])
+                offset += settings_length
+
+                (run_count,) = struct.unpack_from('<I', body, offset)
+                offset += 4
+                runs = [list(RUN.unpack_from(body, offset + i * RUN.size)) for i in range(run_count)]
+
+                return cls(seed, settings, runs, ticks, digest)
+
+
+class ReplayRecorder:
+        """Records the game's input every simulation tick."""
+
+        def __init__(self, game: 'AlienInvasion', path: Path, seed: int | None = None) -> None:
+                self.game = game
+                self.path = path
+
+                # Nothing in the game draws random numbers yet; seed anyway so
+                # anything that does later stays reproducible
+                seed = random.getrandbits(32) if seed is None else seed
+                random.seed(seed)
+
+                self.replay = Replay(seed, settings_snapshot(game.settings))
+                self._restarted: bool = False
+
+        def on_restart(self) -> None:
+                self._restarted = True
+
+        def on_tick(self) -> None:
+                bits = self.game.ship.state.to_bits()
+                if self.game.paused:
+                        bits |= PAUSED
+                if self._restarted:
+                        bits |= RESTART
+                        self._restarted = False
+                self.replay.append(bits)
+
+        def save(self) -> None:
+                """Writes the recording, sealed with a digest of the current game state."""
+                self.replay.digest = state_digest(self.game)
+                try:
+                        self.replay.save(self.path)
+                except OSError as e:
+                        print("Could not save replay!:", e)
+
+
+class ReplayPlayer:
+        """Feeds recorded input back into the game one tick at a time."""
+
+        def __init__(self, game: 'AlienInvasion', replay: Replay) -> None:
+                self.game = game
+                self.replay = replay
+                self._inputs = replay.inputs()
+                self.finished: bool = replay.ticks == 0
+
+        def on_restart(self) -> None:
+                pass
+
+        def on_tick(self) -> None:
+                bits = next(self._inputs, None)
+                if bits is None:
+                        self.finished = True
+                        return
+
+                game = self.game
+                if bits & RESTART:
+                        game.restart_game()
+                if bool(bits & PAUSED) != game.paused:
+                        game._toggle_pause()
+                game.ship.state.apply_bits(bits)
+
+                self.finished = game.tick_count + 1 >= self.replay.ticks
+
+
+@dataclass
+class PlaybackResult:
+        """Outcome of playing a replay back."""
+        game: 'AlienInvasion'
+        ticks: int
+        seconds: float
+        matched: bool
+
+
+def play(path: Path, overrides: dict | None = None, profile: bool = False) -> PlaybackResult:
+        """
+        Plays a replay headless at uncapped speed and reports whether the final
+        state matches the recording. Score files go to a temporary directory
+        unless `overrides` says otherwise.
+        """
+        # Imported here so the file format can be used without pygame
+        from Alien_Invasion import AlienInvasion
+        import settings
+
+        replay = Replay.load(path)
+        random.seed(replay.seed)
+
+        defaults = settings.Settings(headless=True, uncapped=True)
+        with tempfile.TemporaryDirectory(prefix='alien-replay-') as scratch:
+                game = AlienInvasion(headless=True, uncapped=True, overrides={
+                        **settings_overrides(replay.settings, defaults),
+                        'score_file': Path(scratch) / 'scores.json',
+                        'score_history_file': Path(scratch) / 'scores.db',
+                        'profiler': profile,
+                        **(overrides or {}),
+                })
+                player = ReplayPlayer(game, replay)
+                game.replay = player
+
+                try:
+                        start = time.perf_counter()
+                        while not player.finished:
+                                game.step()
+                        seconds = time.perf_counter() - start
+                finally:
+                        game.stats.close()
+
+        return PlaybackResult(game, game.tick_count, seconds, state_digest(game) == replay.digest)
+
+
+def main() -> None:
+        parser = argparse.ArgumentParser(description="Play an Alien Invasion replay headless and verify it.")
+        parser.add_argument('file', type=Path)
+        parser.add_argument('--profile', action='store_true', help="report the profiler's worst frame")
+        args = parser.parse_args()
+
+        result = play(args.file, profile=args.profile)
+        stats = result.game.stats
+        print(f"{result.ticks} ticks in {result.seconds:.2f}s, score {stats.score}, wave {stats.wave}")
+
+        if args.profile:
+                worst = result.game.profiler.snapshot()['worst']
+                if worst:
+                        print(f"worst frame #{worst['frame']}: {worst['frame_ms']:.2f} ms")
+                        for label, spent in worst['sections'].items():
+                                print(f"  {label:<14}{spent:8.3f} ms")
+
+        print("state matches recording" if result.matched else "STATE DIVERGED from recording")
+        raise SystemExit(0 if result.matched else 1)
+
+
+if __name__ == '__main__':
+        main()
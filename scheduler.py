@@ -0,0 +1,55 @@
+"""
+Timer service for Alien Invasion.
+
+Runs callbacks once the game's simulation clock reaches their due time, so
+delays (the pause before a wave starts, the pause before the lose screen)
+never block the loop: input and rendering carry on while a timer runs.
+"""
+
+from dataclasses import dataclass, field
+from itertools import count
+from typing import Callable
+import heapq
+
+
+@dataclass(order=True)
+class ScheduledEvent:
+        """Holds one pending callback, ordered by due time then insertion."""
+        due: float
+        sequence: int
+        callback: Callable = field(compare=False)
+        args: tuple = field(compare=False, default=())
+        cancelled: bool = field(compare=False, default=False)
+
+
+class Scheduler:
+        """Min-heap of callbacks keyed by simulation time in milliseconds."""
+
+        def __init__(self) -> None:
+                self.now: float = 0.0
+                self._events: list[ScheduledEvent] = []
+                self._sequence = count()
+
+        def schedule(self, delay_ms: float, callback: Callable, *args) -> ScheduledEvent:
+                """Runs `callback(*args)` once `delay_ms` of simulation time has passed."""
+                event = ScheduledEvent(self.now + delay_ms, next(self._sequence), callback, args)
+                heapq.heappush(self._events, event)
+                return event
+
+        def cancel(self, event: ScheduledEvent) -> None:
+                event.cancelled = True
+
+        def clear(self) -> None:
+                """Drops every pending event."""
+                self._events.clear()
+
+        def advance(self, now: float) -> None:
+                """Moves the clock to `now` and runs every event that fell due, in order."""
+                self.now = now
+                while self._events and self._events[0].due <= now:
+                        event = heapq.heappop(self._events)
+                        if not event.cancelled:
+                                event.callback(*event.args)
+
+        def __len__(self) -> int:
+                return sum(not event.cancelled for event in self._events)
@@ -0,0 +1,143 @@
+"""
+SQLite score history and leaderboard for Alien Invasion.
+
+Every finished game is stored with its score, wave reached, duration,
+shots fired and accuracy. Inserts are batched on a background thread that
+owns the database connection, and the leaderboards are re-queried there
+after each batch, so the game thread only ever reads cached results.
+"""
+
+from dataclasses import dataclass
+from pathlib import Path
+import queue
+import sqlite3
+import threading
+import time
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS games (
+        id INTEGER PRIMARY KEY,
+        score INTEGER NOT NULL,
+        wave INTEGER NOT NULL,
+        duration_ms INTEGER NOT NULL,
+        shots_fired INTEGER NOT NULL,
+        hits INTEGER NOT NULL,
+        accuracy REAL NOT NULL,
+        finished_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS games_by_score ON games (score DESC);
+CREATE INDEX IF NOT EXISTS games_by_wave ON games (wave DESC, score DESC);
+"""
+
+COLUMNS = "score, wave, duration_ms, shots_fired, hits, accuracy, finished_at"
+
+
+@dataclass
+class GameRecord:
+        """Holds the results of one finished game."""
+        score: int
+        wave: int
+        duration_ms: int
+        shots_fired: int
+        hits: int
+        accuracy: float
+        finished_at: float
+
+
+class ScoreStore:
+        """
+        Background-threaded SQLite store of finished games.
+
+        `add` only queues a record. The writer thread inserts queued records in
+        batches with executemany, then refreshes the cached top-K leaderboards
+        that `top_scores` and `top_waves` return.
+        """
+
+        def __init__(self, path: Path, top_k: int = 5, batch_size: int = 64) -> None:
+                self.path = path
+                self.top_k = top_k
+                self.batch_size = batch_size
+
+                self._queue: queue.Queue[GameRecord | None] = queue.Queue()
+                self._lock = threading.Lock()
+                self._top_scores: list[GameRecord] = []
+                self._top_waves: list[GameRecord] = []
+
+                self._thread = threading.Thread(target=self._run, name='score-store', daemon=True)
+                self._thread.start()
+
+        @staticmethod
+        def record(score: int, wave: int, duration_ms: int, shots_fired: int, hits: int) -> GameRecord:
+                """Builds a record for a game that just finished."""
+                accuracy = hits / shots_fired if shots_fired else 0.0
+                return GameRecord(score, wave, duration_ms, shots_fired, hits, accuracy, time.time())
+
+        def add(self, record: GameRecord) -> None:
+                """Queues a finished game for insertion."""
+                self._queue.put(record)
+
+        def top_scores(self) -> list[GameRecord]:
+                """Cached best games by score."""
+                with self._lock:
+                        return list(self._top_scores)
+
+        def top_waves(self) -> list[GameRecord]:
+                """Cached best games by wave reached."""
+                with self._lock:
+                        return list(self._top_waves)
+
+        def close(self) -> None:
+                """Inserts anything still queued and stops the thread."""
+                self._queue.put(None)
+                self._thread.join()
+
+        def _query(self, connection: sqlite3.Connection, order: str) -> list[GameRecord]:
+                rows = connection.execute(f"SELECT {COLUMNS} FROM games ORDER BY {order} LIMIT ?", (self.top_k,))
+                return [GameRecord(*row) for row in rows]
+
+        def _refresh(self, connection: sqlite3.Connection) -> None:
+                top_scores = self._query(connection, "score DESC")
+                top_waves = self._query(connection, "wave DESC, score DESC")
+                with self._lock:
+                        self._top_scores = top_scores
+                        self._top_waves = top_waves
+
+        def _run(self) -> None:
+                try:
+                        connection = sqlite3.connect(self.path)
+                        connection.executescript(SCHEMA)
+                        self._refresh(connection)
+                except sqlite3.Error as e:
+                        print("Score history unavailable!:", e)
+                        return
+
+                closing = False
+                while not closing:
+                        # Block for one record, then drain whatever else is queued
+                        batch = [self._queue.get()]
+                        while len(batch) < self.batch_size:
+                                try:
+                                        batch.append(self._queue.get_nowait())
+                                except queue.Empty:
+                                        break
+
+                        closing = None in batch
+                        records = [record for record in batch if record is not None]
+                        if not records:
+                                continue
+
+                        try:
+                                with connection:
+                                        connection.executemany(
+                                                f"INSERT INTO games ({COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                                                [
+                                                        (r.score, r.wave, r.duration_ms, r.shots_fired, r.hits, r.accuracy, r.finished_at)
+                                                        for r in records
+                                                ]
+                                        )
+                                self._refresh(connection)
+                        except sqlite3.Error as e:
+                                print("Could not save score history!:", e)
+
+                connection.close()
@@ -0,0 +1,103 @@
+"""
+Background persistence of the high score file for Alien Invasion.
+
+Score updates are handed to a writer thread that coalesces them and writes
+at most once per interval (or immediately when flushed), so the game loop
+never blocks on json.dumps or disk I/O. Files are replaced atomically so a
+crash never leaves a truncated scores.json behind.
+"""
+
+from pathlib import Path
+import json
+import os
+import threading
+import time
+
+
+class ScoreWriter:
+        """
+        Coalescing, rate-limited writer thread for JSON score files.
+
+        `submit` only records the latest contents; the thread writes them once
+        `interval` seconds have passed since the previous write, or straight
+        away after `flush`.
+        """
+
+        def __init__(self, interval: float) -> None:
+                self.interval = interval
+
+                self._cond = threading.Condition()
+                self._pending: tuple[Path, dict] | None = None
+                self._flush_requested: bool = False
+                self._writing: bool = False
+                self._closed: bool = False
+                self._next_write: float = 0.0
+
+                # Counters
+                self.submitted: int = 0
+                self.written: int = 0
+
+                self._thread = threading.Thread(target=self._run, name='score-writer', daemon=True)
+                self._thread.start()
+
+        def submit(self, path: Path, scores: dict) -> None:
+                """Queues `scores` for `path`, replacing anything not yet written."""
+                with self._cond:
+                        self._pending = (path, dict(scores))
+                        self.submitted += 1
+                        self._cond.notify()
+
+        def flush(self, wait: bool = False) -> None:
+                """Writes any pending scores now, optionally blocking until done."""
+                with self._cond:
+                        self._flush_requested = self._pending is not None
+                        self._cond.notify()
+                        if wait:
+                                self._cond.wait_for(lambda: self._pending is None and not self._writing)
+
+        def close(self) -> None:
+                """Writes any pending scores and stops the thread."""
+                with self._cond:
+                        self._closed = True
+                        self._cond.notify()
+                self._thread.join()
+
+        def _ready(self) -> bool:
+                return self._pending is not None and (
+                        self._flush_requested or self._closed or time.monotonic() >= self._next_write
+                )
+
+        def _run(self) -> None:
+                while True:
+                        with self._cond:
+                                while not self._ready():
+                                        if self._closed:
+                                                return
+                                        timeout = None if self._pending is None else self._next_write - time.monotonic()
+                                        self._cond.wait(timeout)
+
+                                path, scores = self._pending
+                                self._pending = None
+                                self._flush_requested = False
+                                self._writing = True
+
+                        self._write(path, scores)
+
+                        with self._cond:
+                                self._writing = False
+                                self._next_write = time.monotonic() + self.interval
+                                self.written += 1
+                                self._cond.notify_all()
+
+        @staticmethod
+        def _write(path: Path, scores: dict) -> None:
+                """Writes to a temp file beside `path`, then renames it into place."""
+                temp = path.with_name(path.name + '.tmp')
+                try:
+                        with open(temp, 'w') as file:
+                                file.write(json.dumps(scores, indent=4))
+                                file.flush()
+                                os.fsync(file.fileno())
+                        os.replace(temp, path)
+                except OSError as e:
+                        print("Could not save scores!:", e)
@@ -21,27 +21,49 @@ class Settings:
 
         DEBUGGING: bool = False
 
+        # Headless mode (no display or audio device, e.g. CI and batch servers)
+        headless: bool = False
+        headless_screen_size: tuple[int, int] = (1280, 720)
+        uncapped: bool = False
+
         # General Settings
         name: str = '👾 Alien Invasion 👾'
         icon: Path = paths.Graphics.icon
         background: Path = paths.Graphics.background
-        fps: int = 60
+        fps: int = 60  # Render cap (0 = unlimited)
+        sim_rate: int = 60  # Fixed simulation ticks per second
+        max_catchup_steps: int = 5  # Most ticks run in one frame before dropping time
+        interpolate: bool = False  # Draw moving sprites part way into the next tick
+        ready_delay_ms: int = 500  # Hold after a horde finishes spawning
+        lose_delay_ms: int = 1000  # Hold before the lose screen appears
+        lose_screen_wake_ms: int = 250  # Longest the idle lose screen sleeps waiting for input
+        dirty_rendering: bool = False  # Push only changed regions instead of flipping
+        profiler: bool = False  # Start with the frame profiler overlay on (toggle with F3)
+        profiler_window: int = 120  # Frames kept for the profiler's rolling averages
+        report_startup: bool = False  # Print the startup timing breakdown after the first frame
+        record_replay: Path | None = None  # Record every tick's input to this replay file
+
+        # Caches
+        text_cache_size: int = 256  # Rendered text surfaces kept by the LRU text cache
+        asset_cache: Path | None = paths.File.cache  # Baked image buffers (None = always decode)
+        texture_atlas: bool = True  # Pack sprite images into one surface
 
         # Computed after init
         screen_size: tuple[int, int] = field(init=False)
-        font_cache: dict[str, dict[int, pygame.font.Font]] = field(default_factory=dict)
         fonts: dict[str, str] = field(default_factory=lambda: {
                 'ss_reg': 'assets/fonts/silkscreen/silkscreen_regular.ttf',
                 'ss_bold': 'assets/fonts/silkscreen/silkscreen_bold.ttf'
         })
 
         # UI / GUI Settings
-        hi_score_file: Path = paths.File.scores
         hi_score_font: Path = paths.Font.regular
         hi_score_size: int = field(init=False)
         hi_score_loc: tuple[int, int] = field(init=False)
 
         score_file: Path = paths.File.scores
+        score_save_interval: float = 2.0  # Seconds between background hi-score writes
+        score_history_file: Path = paths.File.history
+        leaderboard_size: int = 5
         score_font: Path = paths.Font.regular
         score_size: int = field(init=False)
         score_loc: tuple[int, int] = field(init=False)
@@ -80,6 +102,12 @@ class Settings:
         impact_noise: Path = paths.Audio.impact
         laser_size: tuple[int, int] = field(init=False)
         laser_speed: int = field(init=False)
+        laser_pool_size: int = 32
+
+        # Sound settings
+        laser_sound_channels: int = 4  # Mixer channels reserved per effect
+        impact_sound_channels: int = 4
+        sound_plays_per_tick: int = 1  # Further plays of an effect in one tick are dropped
 
         # Alien settings
         alien_image: Path = paths.Graphics.alien
@@ -92,6 +120,7 @@ class Settings:
         horde_advance: int = field(init=False)
         horde_direction: int = 1
         horde_padding: int = field(init=False)
+        horde_engine: str = 'sprites'  # 'sprites' or 'numpy' (vectorized, needs NumPy)
 
         def __post_init__(self):
                 """
@@ -176,8 +205,12 @@ class Settings:
                 """
                 Compute the usable screen area for the game window.
 
-                Adjust for macOS menu bar if necessary.
+                Adjust for macOS menu bar if necessary. Headless runs use a fixed
+                size and never query the desktop.
                 """
+                if self.headless:
+                        return self.headless_screen_size
+
                 pygame.display.init()
 
                 if self.DEBUGGING:
@@ -2,7 +2,6 @@
 Ship entity for the Alien Invasion game.
 """
 
-from laser import Laser
 from typing import TYPE_CHECKING
 import pygame
 from dataclasses import dataclass
@@ -13,7 +12,7 @@ if TYPE_CHECKING:
         from Alien_Invasion import AlienInvasion
 
 
-@dataclass
+@dataclass(slots=True)
 class ShipState:
         """Dataclass to hold movement and firing state for the ship"""
         moving_right: bool = False
@@ -22,10 +21,25 @@ class ShipState:
         firing_rapid: bool = False
         last_shot_time: int = 0
 
+        def to_bits(self) -> int:
+                """Packs the input flags into bits 0-3, for replay recording."""
+                return self.moving_right | self.moving_left << 1 | self.firing << 2 | self.firing_rapid << 3
+
+        def apply_bits(self, bits: int) -> None:
+                """Restores the input flags packed by `to_bits`."""
+                self.moving_right = bool(bits & 1)
+                self.moving_left = bool(bits & 2)
+                self.firing = bool(bits & 4)
+                self.firing_rapid = bool(bits & 8)
+
 
 class Ship(pygame.sprite.Sprite):
         """Represents the player's ship in the game world."""
 
+        # Slotted like the aliens and lasers, ShipState included (about 530
+        # bytes per ship with instance __dicts, 465 without)
+        __slots__ = ('_Sprite__g', 'game', 'settings', 'screen_rect', 'image', 'rect', 'state')
+
         # Initialize local variables
         def __init__(self, game: 'AlienInvasion', resources=None) -> None:
 
@@ -35,23 +49,12 @@ class Ship(pygame.sprite.Sprite):
                 # Basic references to AlienInvasion class and Settings class
                 self.game = game
                 self.settings = game.settings
-                self.resources = resources
 
-                # Main display surface and its bounding rectangle
-                self.screen_image: pygame.Surface = game.screen
+                # Display bounding rectangle
                 self.screen_rect: pygame.Rect = game.screen_rect
 
-                # Load ship image from preloaded resources if provided
-                if self.resources:
-                        self.image: pygame.Surface = pygame.transform.scale(
-                                self.resources.ship_image,
-                                self.settings.ship_size
-                        ).convert_alpha()
-                else:
-                        self.image: pygame.Surface = pygame.transform.scale(
-                                pygame.image.load(self.settings.ship_image),
-                                self.settings.ship_size
-                        ).convert_alpha()
+                # Ship image comes pre-scaled from the shared asset registry
+                self.image: pygame.Surface = (resources or game.resources).ship_image
 
                 # Rect for sprite
                 self.rect: pygame.Rect = self.image.get_rect()
@@ -73,34 +76,42 @@ class Ship(pygame.sprite.Sprite):
                 if self.game.paused or self.game.you_lose:
                         return
 
-                # Relative time for pause
-                now = pygame.time.get_ticks()
-                relative_now = now - self.game.pause_duration
+                # Simulation time (stops while paused, so cooldowns carry over)
+                relative_now = self.game.sim_time
 
                 # Base fire
                 if self.state.firing and (relative_now - self.state.last_shot_time >= self.settings.ship_base_fire_rate):
-                        self.game.lasers.add(Laser(self.game))
+                        self.game.lasers.add(self.game.laser_pool.acquire(self.rect.centerx, self.rect.top))
+                        self.game.stats.shots_fired += 1
                         self.state.last_shot_time = relative_now
 
                 # Rapid fire
                 elif self.state.firing and self.state.firing_rapid and (
                     relative_now - self.state.last_shot_time >= self.settings.ship_rapid_fire_rate
                 ):
-                        self.game.lasers.add(Laser(self.game))
+                        self.game.lasers.add(self.game.laser_pool.acquire(self.rect.centerx, self.rect.top))
+                        self.game.stats.shots_fired += 1
                         self.state.last_shot_time = relative_now
 
+        def _speed(self) -> int:
+                """Sideways speed for the current firing state (firing slows the ship)."""
+                if self.state.firing and self.state.firing_rapid:
+                        return self.settings.ship_rapid_firing_speed
+                if self.state.firing:
+                        return self.settings.ship_base_firing_speed
+                return self.settings.ship_speed
+
+        def velocity(self) -> int:
+                """Returns how far the ship will move sideways on its next tick."""
+                return self._speed() * (self.state.moving_right - self.state.moving_left)
+
         def update(self) -> None:
                 """Update ship position and firing based on key press flags."""
 
                 # Fire lasers if conditions are met
                 self._fire_laser()
 
-                # Firing slows ship
-                speed: int = self.settings.ship_speed
-                if self.state.firing and self.state.firing_rapid:
-                        speed = self.settings.ship_rapid_firing_speed
-                elif self.state.firing:
-                        speed = self.settings.ship_base_firing_speed
+                speed: int = self._speed()
 
                 # Rightward movement and wrapping
                 if self.state.moving_right:
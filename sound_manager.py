@@ -0,0 +1,111 @@
+"""
+Sound effect playback for Alien Invasion.
+
+Each effect is decoded once into an in-memory Sound by the asset registry
+and gets its own reserved pool of mixer channels. When every channel in a
+pool is busy the oldest voice is stolen, and an effect plays at most a set
+number of times per simulation tick, so a frame with twenty kills mixes one
+impact instead of queueing twenty.
+"""
+
+from pathlib import Path
+from typing import Callable
+import pygame
+from asset_registry import AssetRegistry, SilentSound
+
+
+class SoundEffect:
+        """A decoded sound bound to a fixed pool of reserved channels."""
+
+        def __init__(self, sound: pygame.mixer.Sound, channels: list[pygame.mixer.Channel],
+                     tick: Callable[[], int], plays_per_tick: int) -> None:
+                self.sound = sound
+                self.channels = channels
+                self.tick = tick
+                self.plays_per_tick = plays_per_tick
+
+                # Next channel to steal when the whole pool is busy (oldest voice)
+                self._next: int = 0
+
+                # Plays so far in the current tick
+                self._tick: int = -1
+                self._plays: int = 0
+
+                # Counters
+                self.played: int = 0
+                self.stolen: int = 0
+                self.limited: int = 0
+
+        def play(self, loops: int = 0, maxtime: int = 0, fade_ms: int = 0) -> None:
+                """Plays the effect unless it already played enough times this tick."""
+                tick = self.tick()
+                if tick != self._tick:
+                        self._tick = tick
+                        self._plays = 0
+                if self._plays >= self.plays_per_tick:
+                        self.limited += 1
+                        return
+                self._plays += 1
+
+                # Prefer an idle channel, otherwise cut off the oldest voice
+                channel = next((channel for channel in self.channels if not channel.get_busy()), None)
+                if channel is None:
+                        channel = self.channels[self._next]
+                        self._next = (self._next + 1) % len(self.channels)
+                        self.stolen += 1
+
+                channel.play(self.sound, loops, maxtime, fade_ms)
+                self.played += 1
+
+        def stats(self) -> dict[str, int]:
+                return {
+                        'channels': len(self.channels),
+                        'played': self.played,
+                        'stolen': self.stolen,
+                        'limited': self.limited,
+                }
+
+
+class SoundManager:
+        """
+        Hands out SoundEffects, reserving mixer channels for each as it is
+        created. `tick` returns the current simulation tick for rate limiting.
+        Without a working mixer every effect is silent.
+        """
+
+        def __init__(self, assets: AssetRegistry, tick: Callable[[], int], plays_per_tick: int = 1) -> None:
+                self.assets = assets
+                self.tick = tick
+                self.plays_per_tick = plays_per_tick
+                self.audio: bool = assets.audio and pygame.mixer.get_init() is not None
+
+                self.effects: dict[Path, SoundEffect] = {}
+                self._reserved: int = 0
+
+        def effect(self, path: Path, channels: int) -> 'SoundEffect | SilentSound':
+                """Returns the effect at `path` with `channels` reserved channels of its own."""
+                if not self.audio:
+                        return SilentSound()
+
+                key = Path(path)
+                if key in self.effects:
+                        return self.effects[key]
+
+                # Reserved channels are never picked by plain Sound.play calls
+                first = self._reserved
+                self._reserved += channels
+                if pygame.mixer.get_num_channels() < self._reserved:
+                        pygame.mixer.set_num_channels(self._reserved)
+                pygame.mixer.set_reserved(self._reserved)
+
+                effect = SoundEffect(
+                        self.assets.sound(path),
+                        [pygame.mixer.Channel(index) for index in range(first, self._reserved)],
+                        self.tick,
+                        self.plays_per_tick
+                )
+                self.effects[key] = effect
+                return effect
+
+        def stats(self) -> dict[str, dict[str, int]]:
+                return {str(path): effect.stats() for path, effect in self.effects.items()}
@@ -0,0 +1,78 @@
+"""
+Font and rendered-text caching for Alien Invasion.
+
+Fonts are opened once per (path, size). Rendered text surfaces are kept in
+a bounded least-recently-used cache so repeated strings (button captions,
+counters that flip back and forth) never go through font.render twice.
+"""
+
+from collections import OrderedDict
+from pathlib import Path
+import pygame
+
+
+class FontManager:
+        """Opens each font file once per point size."""
+
+        def __init__(self) -> None:
+                self._fonts: dict[tuple[Path, int], pygame.font.Font] = {}
+
+        def get(self, path: Path, size: int) -> pygame.font.Font:
+                key = (Path(path), size)
+                font = self._fonts.get(key)
+
+                if font is None:
+                        font = pygame.font.Font(path, size)
+                        self._fonts[key] = font
+
+                return font
+
+
+class TextCache:
+        """
+        LRU cache of rendered text surfaces keyed by (font, text, color, antialias).
+
+        Returned surfaces are shared between callers and must not be drawn on.
+        """
+
+        def __init__(self, maxsize: int = 256) -> None:
+                self.maxsize = maxsize
+                self._surfaces: OrderedDict[tuple, pygame.Surface] = OrderedDict()
+
+                # Counters
+                self.hits: int = 0
+                self.misses: int = 0
+
+        def render(
+                self,
+                font: pygame.font.Font,
+                text: str,
+                color: str | tuple[int, int, int],
+                antialias: bool = False
+        ) -> pygame.Surface:
+                """Returns `text` rendered in `font`, rasterizing only on a miss."""
+                key = (font, text, tuple(pygame.Color(color)), antialias)
+                surface = self._surfaces.get(key)
+
+                if surface is not None:
+                        self._surfaces.move_to_end(key)
+                        self.hits += 1
+                        return surface
+
+                self.misses += 1
+                surface = font.render(text, antialias, color)
+                self._surfaces[key] = surface
+
+                # Evict the least recently used entry once over capacity
+                if len(self._surfaces) > self.maxsize:
+                        self._surfaces.popitem(last=False)
+
+                return surface
+
+        def stats(self) -> dict[str, int]:
+                return {
+                        'size': len(self._surfaces),
+                        'maxsize': self.maxsize,
+                        'hits': self.hits,
+                        'misses': self.misses,
+                }